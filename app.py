@@ -1,5 +1,7 @@
 import streamlit as st
 import yaml
+import copy
+import functools
 import tempfile
 import os
 import plotly.graph_objects as go
@@ -9,6 +11,11 @@ import pandas as pd
 
 from clarity.scorer import Template, score_detailed
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Configure page
 st.set_page_config(
     page_title="ClarityAI - Train LLMs with Teacher-Style Rubrics",
@@ -31,9 +38,7 @@ if 'sample_texts' not in st.session_state:
         "This comprehensive guide offers detailed insights into machine learning algorithms with practical examples"
     ]
 
-def create_default_template():
-    """Create a default template for new users."""
-    default_yaml = """name: default_template
+DEFAULT_TEMPLATE_YAML = """name: default_template
 description: A sample template for getting started with ClarityAI
 
 rules:
@@ -57,12 +62,21 @@ rules:
     params:
       pattern: "[A-Z][a-z]+"
 """
-    return default_yaml
+
+def create_default_template():
+    """Create a default template for new users."""
+    return DEFAULT_TEMPLATE_YAML
+
+@functools.lru_cache(maxsize=32)
+def _load_template_yaml(yaml_text):
+    """Parse template YAML, memoized since Streamlit reruns the script on every interaction."""
+    return yaml.load(yaml_text, Loader=_YamlLoader)
 
 def parse_template_yaml(yaml_text):
     """Parse YAML text into a Template object."""
     try:
-        data = yaml.safe_load(yaml_text)
+        # Copy so add_rule() never shares params with the cached parse
+        data = copy.deepcopy(_load_template_yaml(yaml_text))
         template = Template(data.get('name', 'custom'))
         template.description = data.get('description', '')
         
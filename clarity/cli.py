@@ -5,19 +5,20 @@ ClarityAI Command Line Interface
 Usage:
     clarity score <text_file> --template <template_file>
     clarity score --text "Direct text input" --template <template_file>
+    clarity score --text "Direct text input" --template <template_file> --format json
     clarity demo --model <model_name>
 """
 
 import argparse
 import sys
 import os
-from typing import Optional
+from typing import List, Optional
 import json
 
 from .scorer import score, score_detailed, Template
 
 
-def score_command(args):
+def score_command(args: argparse.Namespace) -> int:
     """Handle the 'clarity score' command."""
     
     # Get text input
@@ -42,6 +43,9 @@ def score_command(args):
     try:
         if args.detailed:
             result = score_detailed(text, args.template)
+            if args.format == 'json':
+                print(json.dumps(result))
+                return 0
             print(f"Overall Score: {result['total_score']:.3f}")
             print(f"Total Weight: {result['total_weight']}")
             print("\nRule Breakdown:")
@@ -52,7 +56,10 @@ def score_command(args):
                     print(f"  ✓ {rule_score['rule_type']} (weight: {rule_score['weight']}): {rule_score['raw_score']:.3f} → {rule_score['weighted_score']:.3f}")
         else:
             result = score(text, args.template)
-            print(f"Score: {result:.3f}")
+            if args.format == 'json':
+                print(json.dumps({"score": result}))
+            else:
+                print(f"Score: {result:.3f}")
         
         return 0
     
@@ -61,7 +68,7 @@ def score_command(args):
         return 1
 
 
-def demo_command(args):
+def demo_command(args: argparse.Namespace) -> int:
     """Handle the 'clarity demo' command."""
     
     try:
@@ -130,7 +137,7 @@ def demo_command(args):
         return 1
 
 
-def create_template_command(args):
+def create_template_command(args: argparse.Namespace) -> int:
     """Handle the 'clarity create-template' command."""
     
     template = Template(args.name)
@@ -151,13 +158,11 @@ def create_template_command(args):
         return 1
 
 
-def train_command(args):
+def train_command(args: argparse.Namespace) -> int:
     """Handle the 'clarity train' command."""
     
     try:
-        import sys
-        sys.path.append('/Users/coreyalejandro/Repos/clarity-ai')
-        from fix_trainer_simple import train_model_real as train_model
+        from .trainer import train_model
         
         # Check that required files exist
         if not os.path.exists(args.template):
@@ -177,15 +182,18 @@ def train_command(args):
         result = train_model(
             model_name=args.model,
             template_path=args.template,
-            num_epochs=max(1, args.steps // 5),  # Convert steps to epochs
+            max_steps=args.steps,
             learning_rate=args.learning_rate,
-            output_dir=args.output,
+            batch_size=args.batch_size,
+            output_dir=args.output
         )
         
         if result["status"] == "success":
             print(f"\n✅ Training completed successfully!")
-            print(f"Model saved to: {result['model_path']}")
-            print(f"Message: {result['message']}")
+            print(f"Run ID: {result['run_id']}")
+            print(f"Average reward: {result['average_reward']:.3f}")
+            print(f"Final reward: {result['final_reward']:.3f}")
+            print(f"Output: {result['output_dir']}")
             return 0
         else:
             print(f"\n❌ Training failed: {result.get('error', 'Unknown error')}")
@@ -193,15 +201,19 @@ def train_command(args):
             
     except ImportError as e:
         print(f"Error: Missing training dependencies: {e}")
-        print("Install with: pip install datasets")
+        print("Install with: pip install torch transformers")
         return 1
     except Exception as e:
         print(f"Error during training: {e}")
         return 1
 
 
-def main():
-    """Main CLI entry point."""
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main CLI entry point.
+    
+    Args:
+        argv: Argument list to parse instead of sys.argv[1:]
+    """
     
     parser = argparse.ArgumentParser(
         description="ClarityAI - Train LLMs with teacher-style rubrics",
@@ -210,6 +222,7 @@ def main():
 Examples:
   clarity score example.txt --template rubric.yaml
   clarity score --text "Hello world" --template rubric.yaml --detailed
+  clarity score --text "Hello world" --template rubric.yaml --format json
   clarity demo --model microsoft/DialoGPT-small
   clarity create-template --name "code-review" --output templates/code.yaml
         """
@@ -224,6 +237,7 @@ Examples:
     score_group.add_argument('--text', help='Direct text input to score')
     score_parser.add_argument('--template', required=True, help='Path to YAML template file')
     score_parser.add_argument('--detailed', action='store_true', help='Show detailed rule breakdown')
+    score_parser.add_argument('--format', choices=['text', 'json'], default='text', help='Output format (default: text)')
     
     # Demo command
     demo_parser = subparsers.add_parser('demo', help='Run a live demo with a language model')
@@ -245,7 +259,7 @@ Examples:
     train_parser.add_argument('--output', default='runs', help='Output directory for training runs (default: runs)')
     
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
@@ -1,9 +1,16 @@
 import re
+import copy
+import functools
 import yaml
-from typing import Dict, Any, Union, List
-from dataclasses import dataclass
+from typing import Dict, Any, Union, List, IO, Callable, Optional, Tuple, cast
+from dataclasses import dataclass, field
 import os
 
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 # Import advanced rules
 try:
     from .advanced_rules import create_advanced_rule, ADVANCED_RULE_TYPES, RuleExplanation
@@ -13,6 +20,50 @@ except ImportError:
     RuleExplanation = None
 
 
+@functools.lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> "re.Pattern":
+    """Compile a regex_match pattern, shared by every rule that uses it."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+class _TextView:
+    """A text plus derived forms that several rules read.
+    
+    The lowercased text and word lists are computed on first use, so rules
+    scoring the same text share one lower()/split() instead of each redoing it.
+    """
+    
+    __slots__ = ('text', '_lower', '_lower_words', '_word_count')
+    
+    _lower: Optional[str]
+    _lower_words: Optional[List[str]]
+    _word_count: Optional[int]
+    
+    def __init__(self, text: str):
+        self.text = text
+        self._lower = None
+        self._lower_words = None
+        self._word_count = None
+    
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+    
+    @property
+    def lower_words(self) -> List[str]:
+        if self._lower_words is None:
+            self._lower_words = self.lower.split()
+        return self._lower_words
+    
+    @property
+    def word_count(self) -> int:
+        if self._word_count is None:
+            self._word_count = len(self.text.split())
+        return self._word_count
+
+
 @dataclass
 class Rule:
     """A single scoring rule with a type and parameters."""
@@ -20,6 +71,36 @@ class Rule:
     rule_type: str
     weight: float
     params: Dict[str, Any]
+    # (rule_type, params snapshot, matcher); built on first evaluation
+    _matcher: Optional[Tuple[str, Dict[str, Any], Callable[[_TextView], float]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary form used in template YAML."""
+        return {
+            'type': self.rule_type,
+            'weight': self.weight,
+            'params': self.params
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Rule':
+        """Create from the dictionary form used in template YAML.
+        
+        The params dict is used as-is, not copied.
+        """
+        return cls(
+            rule_type=data['type'],
+            weight=data.get('weight', 1.0),
+            params=data.get('params') or {}
+        )
+    
+    def __getstate__(self):
+        # The cached matcher holds closures, which do not pickle
+        state = self.__dict__.copy()
+        state['_matcher'] = None
+        return state
     
     def evaluate(self, text: str) -> float:
         """Evaluate this rule against the given text.
@@ -37,42 +118,76 @@ class Rule:
                 return 0.0
         
         # Basic rule types
+        return self._get_matcher()(_TextView(text))
+    
+    def evaluate_batch(self, texts: List[str]) -> List[float]:
+        """Evaluate this rule against several texts.
+        
+        Returns:
+            List[float]: One score between 0.0 and 1.0 per text
+        """
+        return self._evaluate_views([_TextView(text) for text in texts])
+    
+    def _evaluate_view(self, view: _TextView) -> float:
+        """Evaluate against a text view that other rules may share."""
+        if ADVANCED_RULES_AVAILABLE and self.rule_type in ADVANCED_RULE_TYPES:
+            return self.evaluate(view.text)
+        return self._get_matcher()(view)
+    
+    def _evaluate_views(self, views: List[_TextView]) -> List[float]:
+        """Evaluate against several text views, fetching the matcher once."""
+        if ADVANCED_RULES_AVAILABLE and self.rule_type in ADVANCED_RULE_TYPES:
+            return [self.evaluate(view.text) for view in views]
+        
+        matcher = self._get_matcher()
+        return [matcher(view) for view in views]
+    
+    def _get_matcher(self) -> Callable[[_TextView], float]:
+        """Return the per-text scoring function for a basic rule.
+        
+        Per-rule setup (compiled pattern, lowercased phrase, target words) is
+        done once and reused until rule_type or params change.
+        """
+        cached = self._matcher
+        if cached is not None and cached[0] == self.rule_type and cached[1] == self.params:
+            return cached[2]
+        
+        matcher = self._build_matcher()
+        self._matcher = (self.rule_type, dict(self.params), matcher)
+        return matcher
+    
+    def _build_matcher(self) -> Callable[[_TextView], float]:
+        """Build the per-text scoring function for this rule's type and params."""
         if self.rule_type == "regex_match":
-            pattern = self.params.get("pattern", "")
-            if re.search(pattern, text, re.IGNORECASE):
-                return 1.0
-            return 0.0
+            search = _compile_pattern(self.params.get("pattern", "")).search
+            return lambda view: 1.0 if search(view.text) else 0.0
             
         elif self.rule_type == "contains_phrase":
-            phrase = self.params.get("phrase", "")
-            if phrase.lower() in text.lower():
-                return 1.0
-            return 0.0
+            phrase = self.params.get("phrase", "").lower()
+            return lambda view: 1.0 if phrase in view.lower else 0.0
             
         elif self.rule_type == "cosine_sim":
             # Simple word overlap for MVP - will enhance with sentence transformers later
-            target = self.params.get("target", "")
-            text_words = set(text.lower().split())
-            target_words = set(target.lower().split())
+            target_words = set(self.params.get("target", "").lower().split())
             if len(target_words) == 0:
-                return 0.0
-            overlap = len(text_words.intersection(target_words))
-            return min(1.0, overlap / len(target_words))
+                return lambda view: 0.0
+            num_targets = len(target_words)
+            return lambda view: min(1.0, len(target_words.intersection(view.lower_words)) / num_targets)
         
         elif self.rule_type == "word_count":
             min_words = self.params.get("min_words", 0)
             max_words = self.params.get("max_words", float('inf'))
-            word_count = len(text.split())
-            if min_words <= word_count <= max_words:
-                return 1.0
-            return 0.0
+            return lambda view: 1.0 if min_words <= view.word_count <= max_words else 0.0
         
         elif self.rule_type == "sentiment_positive":
             # Simple positive word detection for MVP
-            positive_words = ["good", "great", "excellent", "positive", "helpful", "clear"]
-            text_lower = text.lower()
-            matches = sum(1 for word in positive_words if word in text_lower)
-            return min(1.0, matches / 3.0)  # Scale to 0-1
+            positive_words = ("good", "great", "excellent", "positive", "helpful", "clear")
+            
+            def sentiment(view: _TextView) -> float:
+                text_lower = view.lower
+                matches = sum(1 for word in positive_words if word in text_lower)
+                return min(1.0, matches / 3.0)  # Scale to 0-1
+            return sentiment
             
         else:
             raise ValueError(f"Unknown rule type: {self.rule_type}")
@@ -148,10 +263,11 @@ class Template:
         
         total_score = 0.0
         total_weight = 0.0
+        view = _TextView(text)
         
         for rule in self.rules:
             try:
-                rule_score = rule.evaluate(text)
+                rule_score = rule._evaluate_view(view)
                 total_score += rule_score * rule.weight
                 total_weight += rule.weight
             except Exception as e:
@@ -160,6 +276,49 @@ class Template:
         
         return total_score / total_weight if total_weight > 0 else 0.0
     
+    def evaluate_batch(self, texts: List[str]) -> List[float]:
+        """Evaluate several texts, running each rule over the whole batch at once.
+        
+        If a rule raises for a text, its score for that text is None and the
+        rule is left out of that text's weighted average, as in evaluate().
+        
+        Returns:
+            List[float]: The same scores evaluate() gives for each text
+        """
+        texts = list(texts)
+        if not self.rules:
+            return [0.0] * len(texts)
+        
+        total_scores = [0.0] * len(texts)
+        total_weights = [0.0] * len(texts)
+        views = [_TextView(text) for text in texts]
+        
+        for rule in self.rules:
+            # One score per text; None marks a text the rule failed on
+            rule_scores: List[Optional[float]]
+            try:
+                rule_scores = list(rule._evaluate_views(views))
+            except Exception:
+                # Retry text by text so a failure only drops this rule where it fails
+                rule_scores = []
+                for view in views:
+                    try:
+                        rule_scores.append(rule._evaluate_view(view))
+                    except Exception as e:
+                        print(f"Warning: Rule {rule.rule_type} failed with error: {e}")
+                        rule_scores.append(None)
+            
+            for i, rule_score in enumerate(rule_scores):
+                if rule_score is None:
+                    continue
+                total_scores[i] += rule_score * rule.weight
+                total_weights[i] += rule.weight
+        
+        return [
+            total_score / total_weight if total_weight > 0 else 0.0
+            for total_score, total_weight in zip(total_scores, total_weights)
+        ]
+    
     def evaluate_detailed(self, text: str) -> Dict[str, Any]:
         """Evaluate with detailed breakdown of each rule's contribution."""
         if not self.rules:
@@ -168,10 +327,11 @@ class Template:
         rule_scores = []
         total_score = 0.0
         total_weight = 0.0
+        view = _TextView(text)
         
         for rule in self.rules:
             try:
-                rule_score = rule.evaluate(text)
+                rule_score = rule._evaluate_view(view)
                 weighted_score = rule_score * rule.weight
                 total_score += weighted_score
                 total_weight += rule.weight
@@ -266,45 +426,51 @@ class Template:
             return "Very Poor - text fails to meet basic quality standards and requires complete revision"
     
     @classmethod
-    def from_yaml(cls, yaml_path: str):
-        """Load a template from a YAML file."""
-        if not os.path.exists(yaml_path):
-            raise FileNotFoundError(f"Template file not found: {yaml_path}")
-        
-        with open(yaml_path, 'r') as f:
-            data = yaml.safe_load(f)
+    def from_yaml(cls, yaml_path: Union[str, IO]):
+        """Load a template from a YAML file path or a readable file object."""
+        if hasattr(yaml_path, 'read'):
+            data = yaml.load(yaml_path.read(), Loader=_YamlLoader)
+        else:
+            try:
+                st = os.stat(yaml_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Template file not found: {yaml_path}") from None
+            
+            # Parsed data is cached per (path, mtime, size); deep-copy it so callers
+            # mutating rule params never leak into the cache.
+            data = copy.deepcopy(_load_template_cached(yaml_path, st.st_mtime_ns, st.st_size))
         
         template = cls(name=data.get('name', 'default'))
         template.description = data.get('description', '')
         
-        for rule_data in data.get('rules', []):
-            template.add_rule(
-                rule_type=rule_data['type'],
-                weight=rule_data.get('weight', 1.0),
-                **rule_data.get('params', {})
-            )
+        # data is a private copy, so its params dicts can back the rules directly
+        template.rules = [Rule.from_dict(rule_data) for rule_data in data.get('rules', [])]
         
         return template
     
-    def to_yaml(self, yaml_path: str):
-        """Save this template to a YAML file."""
+    def to_yaml(self, yaml_path: Union[str, IO]):
+        """Save this template to a YAML file path or a writable file object."""
         data = {
             'name': self.name,
             'description': self.description,
-            'rules': []
+            'rules': [rule.to_dict() for rule in self.rules]
         }
         
-        for rule in self.rules:
-            rule_data = {
-                'type': rule.rule_type,
-                'weight': rule.weight,
-                'params': rule.params
-            }
-            data['rules'].append(rule_data)
+        text = yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False, indent=2)
+        if hasattr(yaml_path, 'write'):
+            yaml_path.write(text)
+            return
         
         os.makedirs(os.path.dirname(yaml_path), exist_ok=True)
         with open(yaml_path, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False, indent=2)
+            f.write(text)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_template_cached(yaml_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a template file; the stat fields in the key invalidate stale entries."""
+    with open(yaml_path, 'rb') as f:
+        return cast(Dict[str, Any], yaml.load(f.read(), Loader=_YamlLoader))
 
 
 def score(text: str, template: Union[str, Template]) -> float:
@@ -323,6 +489,25 @@ def score(text: str, template: Union[str, Template]) -> float:
     return template.evaluate(text)
 
 
+def score_batch(texts: List[str], template: Union[str, Template]) -> List[float]:
+    """Score several texts against one template.
+    
+    Loads the template once and evaluates rule by rule over the whole batch,
+    giving the same scores as calling score() on each text.
+    
+    Args:
+        texts: Texts to evaluate
+        template: Template object or path to YAML template file
+    
+    Returns:
+        List[float]: One score between 0.0 and 1.0 per text
+    """
+    if isinstance(template, str):
+        template = Template.from_yaml(template)
+    
+    return template.evaluate_batch(texts)
+
+
 def score_detailed(text: str, template: Union[str, Template]) -> Dict[str, Any]:
     """Detailed scoring function with rule-by-rule breakdown.
     
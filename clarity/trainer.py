@@ -9,10 +9,12 @@ import torch
 import yaml
 import json
 import os
+import shutil
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Union, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Union, Any, cast
+from dataclasses import dataclass
 import logging
+from functools import lru_cache
 
 try:
     from transformers import (
@@ -28,12 +30,48 @@ except ImportError as e:
         "Install with: pip install transformers datasets torch"
     )
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from .scorer import Template, score
 
+# Prefer the libyaml-backed C loader for legacy ledger reads when available
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+# The ledger is machine-written, so it is stored as JSON Lines (one run per
+# line) and a finished run is appended without rewriting earlier ones.
+# Whole-document JSON and YAML ledgers written by older versions are still read.
+LEDGER_FILENAME = "training_ledger.jsonl"
+LEGACY_LEDGER_FILENAMES = ("training_ledger.json", "training_ledger.yaml")
+
+
+def _dumps_json(data: Dict[str, Any]) -> bytes:
+    """Serialize a dict of primitives to JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def _loads_json(data: Union[bytes, str]) -> Dict[str, Any]:
+    """Parse JSON bytes or text into a dict."""
+    if ORJSON_AVAILABLE:
+        return cast(Dict[str, Any], orjson.loads(data))
+    return cast(Dict[str, Any], json.loads(data))
+
+
+@dataclass(frozen=True)
 class TrainingConfig:
-    """Configuration for ClarityAI training runs."""
+    """Configuration for ClarityAI training runs.
+    
+    Frozen so a config can be shared between runs and hashed; use
+    dataclasses.replace() to derive a modified copy.
+    """
     
     # Model settings
     model_name: str = "microsoft/DialoGPT-small"
@@ -68,12 +106,22 @@ class TrainingConfig:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return asdict(self)
+        # All fields are primitives, so a shallow copy avoids asdict's deepcopy
+        return dict(self.__dict__)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TrainingConfig':
         """Create from dictionary."""
         return cls(**data)
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes (uses orjson when installed)."""
+        return _dumps_json(self.to_dict())
+    
+    @classmethod
+    def from_json_bytes(cls, data: bytes) -> 'TrainingConfig':
+        """Create from JSON bytes."""
+        return cls.from_dict(_loads_json(data))
 
 
 @dataclass
@@ -99,24 +147,46 @@ class TrainingRun:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        data = asdict(self)
-        data['config'] = self.config.to_dict()
-        return data
+        return {
+            'run_id': self.run_id,
+            'model_name': self.model_name,
+            'template_path': self.template_path,
+            'config': self.config.to_dict(),
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'total_steps': self.total_steps,
+            'average_reward': self.average_reward,
+            'final_reward': self.final_reward,
+            'status': self.status,
+            'error': self.error,
+            'step_rewards': list(self.step_rewards),
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TrainingRun':
         """Create from dictionary."""
-        config_data = data.pop('config')
-        config = TrainingConfig.from_dict(config_data)
+        data = dict(data)
+        config = TrainingConfig.from_dict(data.pop('config'))
+        if data.get('step_rewards') is not None:
+            data['step_rewards'] = list(data['step_rewards'])
         return cls(config=config, **data)
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes (uses orjson when installed)."""
+        return _dumps_json(self.to_dict())
+    
+    @classmethod
+    def from_json_bytes(cls, data: bytes) -> 'TrainingRun':
+        """Create from JSON bytes."""
+        return cls.from_dict(_loads_json(data))
 
 
 class ClarityTrainer:
     """Main trainer class that orchestrates simplified training with ClarityAI scoring."""
     
-    def __init__(self, config: TrainingConfig):
+    def __init__(self, config: TrainingConfig, template: Optional[Template] = None):
         self.config = config
-        self.template = None
+        self.template = template
         self.model = None
         self.tokenizer = None
         self.current_run = None
@@ -130,6 +200,10 @@ class ClarityTrainer:
     
     def load_template(self) -> Template:
         """Load the scoring template."""
+        if self.template is not None:
+            # Already supplied in memory; skip the YAML round-trip
+            return self.template
+        
         if not os.path.exists(self.config.template_path):
             raise FileNotFoundError(f"Template not found: {self.config.template_path}")
         
@@ -221,18 +295,17 @@ class ClarityTrainer:
         return responses
     
     def compute_rewards(self, responses: List[str]) -> List[float]:
-        """Compute rewards using the scoring template."""
-        rewards = []
+        """Compute rewards using the scoring template.
         
-        for response in responses:
-            try:
-                reward = self.template.evaluate(response)
-                rewards.append(reward)
-            except Exception as e:
-                self.logger.warning(f"Error scoring response: {e}")
-                rewards.append(0.0)
+        Template.evaluate_batch() already leaves a failing rule out of the
+        affected response's score, so its errors are not retried here.
+        """
+        if self.template is None:
+            self.logger.warning("No template loaded; scoring every response 0.0")
+            return [0.0] * len(responses)
         
-        return rewards
+        # Score the whole batch rule by rule
+        return self.template.evaluate_batch(responses)
     
     def start_training_run(self) -> str:
         """Start a new training run and return the run ID."""
@@ -262,22 +335,8 @@ class ClarityTrainer:
         self.current_run.end_time = datetime.now(timezone.utc).isoformat()
         self.current_run.status = "completed"
         
-        # Save to ledger file
-        ledger_path = os.path.join(self.config.output_dir, "training_ledger.yaml")
-        
-        # Load existing ledger or create new
-        if os.path.exists(ledger_path):
-            with open(ledger_path, 'r') as f:
-                ledger = yaml.safe_load(f) or {'runs': []}
-        else:
-            ledger = {'runs': []}
-        
-        # Add current run
-        ledger['runs'].append(self.current_run.to_dict())
-        
-        # Save ledger
-        with open(ledger_path, 'w') as f:
-            yaml.dump(ledger, f, default_flow_style=False, indent=2)
+        # Append to ledger file
+        ledger_path = append_training_run(self.config.output_dir, self.current_run)
         
         self.logger.info(f"Saved training run to ledger: {ledger_path}")
     
@@ -295,6 +354,7 @@ class ClarityTrainer:
             self.logger.info(f"Starting training for {self.config.max_steps} steps")
             
             # Training loop
+            last_checkpoint_dir = None
             for step in range(self.config.max_steps):
                 self.logger.info(f"Step {step + 1}/{self.config.max_steps}")
                 
@@ -323,12 +383,18 @@ class ClarityTrainer:
                     self.model.save_pretrained(checkpoint_dir)
                     self.tokenizer.save_pretrained(checkpoint_dir)
                     self.logger.info(f"Saved checkpoint: {checkpoint_dir}")
+                    if step + 1 == self.config.max_steps:
+                        last_checkpoint_dir = checkpoint_dir
             
-            # Save final model
+            # Save final model; a checkpoint taken on the last step already
+            # holds the same weights, so copy its files instead of re-saving
             final_dir = os.path.join(self.config.output_dir, run_id, "final")
-            os.makedirs(final_dir, exist_ok=True)
-            self.model.save_pretrained(final_dir)
-            self.tokenizer.save_pretrained(final_dir)
+            if last_checkpoint_dir is not None:
+                _copy_checkpoint(last_checkpoint_dir, final_dir)
+            else:
+                os.makedirs(final_dir, exist_ok=True)
+                self.model.save_pretrained(final_dir)
+                self.tokenizer.save_pretrained(final_dir)
             
             # Save training run
             self.save_training_run()
@@ -358,6 +424,15 @@ class ClarityTrainer:
             }
 
 
+def _copy_checkpoint(src_dir: str, dst_dir: str):
+    """Copy a saved checkpoint directory into dst_dir without re-serializing it.
+    
+    The files are independent copies, so saving into dst_dir later (e.g.
+    after fine-tuning the final model) leaves the checkpoint untouched.
+    """
+    shutil.copytree(src_dir, dst_dir, dirs_exist_ok=True)
+
+
 def train_model(
     model_name: str,
     template_path: str,
@@ -365,6 +440,7 @@ def train_model(
     learning_rate: float = 1.41e-5,
     batch_size: int = 16,
     output_dir: str = "runs",
+    template: Optional[Template] = None,
     **kwargs
 ) -> Dict[str, Any]:
     """
@@ -377,6 +453,7 @@ def train_model(
         learning_rate: Learning rate for training
         batch_size: Batch size for training
         output_dir: Directory to save results
+        template: Template object to score with instead of reading template_path
         **kwargs: Additional config parameters
     
     Returns:
@@ -392,22 +469,98 @@ def train_model(
         **kwargs
     )
     
-    trainer = ClarityTrainer(config)
+    trainer = ClarityTrainer(config, template=template)
     return trainer.train()
 
 
-def load_training_ledger(output_dir: str = "runs") -> List[TrainingRun]:
-    """Load training runs from the ledger."""
-    ledger_path = os.path.join(output_dir, "training_ledger.yaml")
+def _find_ledger(output_dir: str) -> Optional[str]:
+    """Return the ledger path in output_dir, preferring JSON Lines over legacy ledgers."""
+    for filename in (LEDGER_FILENAME,) + LEGACY_LEDGER_FILENAMES:
+        ledger_path = os.path.join(output_dir, filename)
+        if os.path.exists(ledger_path):
+            return ledger_path
+    return None
+
+
+def _read_ledger_file(ledger_path: str) -> Optional[Dict[str, Any]]:
+    """Parse a JSON Lines ledger, or a legacy JSON or YAML one."""
+    # Slurp the file in one read and let the parser work on the whole buffer
+    with open(ledger_path, 'rb') as f:
+        data = f.read()
+    if ledger_path.endswith('.jsonl'):
+        return {'runs': [_loads_json(line) for line in data.splitlines() if line.strip()]}
+    if ledger_path.endswith('.json'):
+        return _loads_json(data)
+    # An empty legacy YAML ledger parses to None
+    return cast(Optional[Dict[str, Any]], yaml.load(data, Loader=_YamlLoader))
+
+
+@lru_cache(maxsize=32)
+def _read_ledger_file_cached(ledger_path: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+    """Parse a ledger file, memoized on its stat signature.
     
+    mtime_ns and size only serve as part of the cache key, so rewriting the
+    file invalidates the entry. Callers must not mutate the returned data.
+    """
+    return _read_ledger_file(ledger_path)
+
+
+def _read_ledger(output_dir: str) -> Optional[Dict[str, Any]]:
+    """Read the raw ledger data, or None if there is no ledger yet."""
+    ledger_path = _find_ledger(output_dir)
+    if ledger_path is None:
+        return None
+    return _read_ledger_file(ledger_path)
+
+
+def _write_ledger(output_dir: str, ledger: Dict[str, Any]) -> str:
+    """Write raw ledger data as JSON Lines and return the ledger path."""
+    ledger_path = os.path.join(output_dir, LEDGER_FILENAME)
+    # Serialize in memory and hand the file a single bytes write
+    with open(ledger_path, 'wb') as f:
+        f.write(b''.join(_dumps_json(run) + b'\n' for run in ledger.get('runs') or []))
+    return ledger_path
+
+
+def append_training_run(output_dir: str, run: TrainingRun) -> str:
+    """Append one training run to the ledger and return the ledger path."""
+    ledger_path = os.path.join(output_dir, LEDGER_FILENAME)
     if not os.path.exists(ledger_path):
+        # Carry runs over from a legacy ledger before the first append
+        legacy = _read_ledger(output_dir)
+        if legacy and legacy.get('runs'):
+            _write_ledger(output_dir, legacy)
+    
+    with open(ledger_path, 'ab') as f:
+        f.write(_dumps_json(run.to_dict()) + b'\n')
+    return ledger_path
+
+
+def save_training_ledger(output_dir: str, runs: List[TrainingRun]) -> str:
+    """Save training runs to the ledger, replacing any existing entries."""
+    return _write_ledger(output_dir, {'runs': [run.to_dict() for run in runs]})
+
+
+def load_training_ledger(output_dir: str = "runs") -> List[TrainingRun]:
+    """Load training runs from the ledger."""
+    ledger_path = _find_ledger(output_dir)
+    if ledger_path is None:
         return []
     
-    with open(ledger_path, 'r') as f:
-        ledger = yaml.safe_load(f)
+    stat = os.stat(ledger_path)
+    return _parse_ledger_data(_read_ledger_file_cached(ledger_path, stat.st_mtime_ns, stat.st_size))
+
+
+def _parse_ledger_data(ledger: Optional[Dict[str, Any]]) -> List[TrainingRun]:
+    """Build TrainingRun objects from already-parsed ledger data.
+    
+    ``ledger`` may be None, e.g. when a legacy YAML ledger file is empty.
+    """
+    if not ledger:
+        return []
     
     runs = []
     for run_data in ledger.get('runs', []):
         runs.append(TrainingRun.from_dict(run_data))
     
-    return runs
\ No newline at end of file
+    return runs
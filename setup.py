@@ -20,6 +20,15 @@ setup(
             "textstat>=0.7.0",
             "scikit-learn>=1.0.0",
         ],
+        "fast": [
+            "orjson>=3.6.0",
+        ],
+        "test": [
+            "pytest>=7.0",
+            "pytest-xdist>=3.0",
+            # streamlit.testing.v1.AppTest first shipped in 1.28
+            "streamlit>=1.28.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -3,21 +3,75 @@ Shared test fixtures and configuration for ClarityAI tests.
 """
 
 import pytest
-import tempfile
 import os
-from pathlib import Path
+import sys
+import types
 from unittest.mock import MagicMock
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+# With CLARITY_TEST_STUB_HF=1, transformers and datasets are replaced by
+# lightweight modules before clarity.trainer imports them, so collection
+# skips the transformers import. Tests that patch clarity.trainer.AutoTokenizer
+# etc. are unaffected; tests marked requires_hf are skipped.
+STUB_HF = os.environ.get("CLARITY_TEST_STUB_HF") == "1"
+
+# Tests marked integration_slow spawn subprocesses and are skipped unless
+# CLARITY_TEST_INTEGRATION_SLOW=1 (CI sets it), keeping local runs fast.
+RUN_INTEGRATION_SLOW = os.environ.get("CLARITY_TEST_INTEGRATION_SLOW") == "1"
+
+
+class _HFStub:
+    """Placeholder for a transformers class; tests patch what they use."""
+    
+    @classmethod
+    def from_pretrained(cls, *args, **kwargs):
+        raise RuntimeError(
+            f"{cls.__name__} is stubbed (CLARITY_TEST_STUB_HF=1); patch it in the test"
+        )
+
+
+def _install_hf_stubs():
+    """Register stand-in transformers/datasets modules unless already imported."""
+    if 'transformers' not in sys.modules:
+        transformers = types.ModuleType('transformers')
+        for name in ('AutoTokenizer', 'AutoModelForCausalLM', 'TrainingArguments', 'GenerationConfig'):
+            setattr(transformers, name, type(name, (_HFStub,), {}))
+        sys.modules['transformers'] = transformers
+    sys.modules.setdefault('datasets', types.ModuleType('datasets'))
+
+
+if STUB_HF:
+    _install_hf_stubs()
+
 from clarity.scorer import Template, Rule
 from clarity.trainer import TrainingConfig
 
 
+def pytest_configure(config):
+    # Markers this conftest acts on are registered here only, not in pytest.ini
+    config.addinivalue_line("markers", "requires_hf: test needs the real transformers library")
+    config.addinivalue_line("markers", "integration_slow: test spawns subprocesses (run with CLARITY_TEST_INTEGRATION_SLOW=1)")
+
+
+def pytest_collection_modifyitems(config, items):
+    skip_hf = pytest.mark.skip(reason="transformers is stubbed (CLARITY_TEST_STUB_HF=1)")
+    skip_slow = pytest.mark.skip(reason="set CLARITY_TEST_INTEGRATION_SLOW=1 to run")
+    for item in items:
+        if STUB_HF and "requires_hf" in item.keywords:
+            item.add_marker(skip_hf)
+        if not RUN_INTEGRATION_SLOW and "integration_slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @pytest.fixture
-def temp_directory():
+def temp_directory(tmp_path):
     """Provide a temporary directory for file tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
 @pytest.fixture
@@ -31,9 +85,9 @@ def sample_template():
     return template
 
 
-@pytest.fixture
-def sample_template_yaml(temp_directory):
-    """Provide a sample template YAML file."""
+@pytest.fixture(scope="session")
+def sample_template_yaml_bytes():
+    """Serialize the sample template YAML once per session."""
     template_data = {
         "name": "test_template",
         "description": "A test template",
@@ -52,10 +106,29 @@ def sample_template_yaml(temp_directory):
         ]
     }
     
+    return yaml.dump(template_data, Dumper=_YamlDumper).encode('utf-8')
+
+
+@pytest.fixture
+def sample_template_yaml(temp_directory, sample_template_yaml_bytes):
+    """Provide a sample template YAML file."""
     template_path = temp_directory / "test_template.yaml"
-    with open(template_path, 'w') as f:
-        yaml.dump(template_data, f)
+    template_path.write_bytes(sample_template_yaml_bytes)
+    return template_path
+
+
+@pytest.fixture(scope="session")
+def word_count_template(tmp_path_factory):
+    """Provide a minimal word_count template file written once per session.
+    
+    Tests that need their own copy should shutil.copy() it into their
+    working directory rather than re-serializing the template.
+    """
+    template = Template("shared")
+    template.add_rule("word_count", 1.0, min_words=1)
     
+    template_path = tmp_path_factory.mktemp("templates") / "word_count_template.yaml"
+    template.to_yaml(str(template_path))
     return template_path
 
 
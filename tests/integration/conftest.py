@@ -0,0 +1,64 @@
+"""
+Shared fixtures for the integration tests.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+
+class _TokenizerSpec:
+    """Attribute surface of the tokenizer that ClarityTrainer touches."""
+    
+    pad_token = None
+    eos_token = None
+    pad_token_id = None
+    eos_token_id = None
+    
+    def encode(self, text, **kwargs): ...
+    def decode(self, token_ids, **kwargs): ...
+    def save_pretrained(self, save_directory): ...
+
+
+class _ModelSpec:
+    """Attribute surface of the causal LM that ClarityTrainer touches."""
+    
+    def to(self, device): ...
+    def parameters(self): ...
+    def generate(self, inputs, **kwargs): ...
+    def save_pretrained(self, save_directory): ...
+
+
+@pytest.fixture
+def mocked_transformers(monkeypatch):
+    """Patch the transformers loaders and optimizer that ClarityTrainer uses.
+    
+    The tokenizer and model are MagicMocks limited to the specs above, so a
+    test can set return values or side effects and assert calls; set
+    ``tokenizer.decode`` to control the generated responses.
+    """
+    tokenizer = MagicMock(spec=_TokenizerSpec)
+    tokenizer.pad_token = None  # load_model() falls back to eos_token
+    tokenizer.eos_token = "<eos>"
+    tokenizer.pad_token_id = 0
+    tokenizer.eos_token_id = 1
+    tokenizer.encode.return_value = [[1, 2, 3]]
+    tokenizer.decode.return_value = "helpful response"
+    
+    model = MagicMock(spec=_ModelSpec)
+    model.to.return_value = model
+    model.parameters.return_value = []
+    model.generate.return_value = [[1, 2, 3, 4, 5]]
+    
+    mocks = SimpleNamespace(
+        tokenizer=tokenizer,
+        model=model,
+        AutoTokenizer=Mock(**{'from_pretrained.return_value': tokenizer}),
+        AutoModelForCausalLM=Mock(**{'from_pretrained.return_value': model}),
+        Adam=Mock(),
+    )
+    monkeypatch.setattr('clarity.trainer.AutoTokenizer', mocks.AutoTokenizer)
+    monkeypatch.setattr('clarity.trainer.AutoModelForCausalLM', mocks.AutoModelForCausalLM)
+    monkeypatch.setattr('clarity.trainer.torch.optim.Adam', mocks.Adam)
+    return mocks
@@ -2,53 +2,63 @@
 Integration tests for the Streamlit application.
 
 These tests verify the functionality of the Streamlit UI components
-and workflows by mocking the Streamlit context and simulating user interactions.
+and workflows, driving the app through Streamlit's in-process AppTest runner.
 """
 
+import io
 import os
-import sys
 import pytest
-import tempfile
 import yaml
-from unittest.mock import patch, MagicMock
 
-# Add the root directory to the path so we can import the app module
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+# AppTest needs Streamlit 1.28+ (the "test" extra); skip on older installs
+AppTest = pytest.importorskip("streamlit.testing.v1").AppTest
 
-# Import the app module
-import app
 from clarity.scorer import Template
 
+APP_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..', "app.py"))
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed once at import; tests compare parse_template_yaml() output against it
+_GOOD_TEMPLATE_YAML = """
+name: test_template
+description: A test template
+rules:
+  - type: contains_phrase
+    weight: 2.0
+    params:
+      phrase: "helpful"
+  - type: word_count
+    weight: 1.0
+    params:
+      min_words: 5
+      max_words: 20
+"""
+_GOOD_TEMPLATE_PARSED = yaml.load(_GOOD_TEMPLATE_YAML, Loader=_YamlLoader)
+
+_BAD_WEIGHT_TEMPLATE_YAML = """
+name: invalid
+description: Invalid YAML
+rules:
+  - type: contains_phrase
+    weight: not_a_number
+"""
 
-@pytest.fixture
-def mock_streamlit():
-    """Mock the streamlit module for testing."""
-    with patch('app.st') as mock_st:
-        # Mock session state
-        mock_st.session_state = {}
-        mock_st.session_state.scores_history = []
-        mock_st.session_state.current_template = None
-        mock_st.session_state.sample_texts = [
-            "Python is a helpful programming language for beginners",
-            "I don't understand this at all"
-        ]
-        
-        # Mock common streamlit functions
-        mock_st.text_area.return_value = "Test text for scoring"
-        mock_st.selectbox.return_value = mock_st.session_state.sample_texts[0]
-        mock_st.radio.return_value = "Use Default Template"
-        mock_st.button.return_value = True
-        
-        # Mock columns
-        col_mock = MagicMock()
-        mock_st.columns.return_value = [col_mock, col_mock, col_mock]
-        
-        yield mock_st
 
+@pytest.fixture(scope="session")
+def app_module():
+    """Import the app module once, on first use rather than at collection."""
+    # tests/ is a package, so pytest has already put the repository root on sys.path
+    import app
+    return app
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def default_template():
-    """Create a default template for testing."""
+    """Create a default template for testing; tests must treat it as read-only."""
     template = Template("test_template")
     template.description = "Test template for integration tests"
     template.add_rule("contains_phrase", 1.0, phrase="helpful")
@@ -59,12 +69,12 @@ def default_template():
 class TestStreamlitApp:
     """Test the Streamlit application functionality."""
     
-    def test_create_default_template(self):
+    def test_create_default_template(self, app_module):
         """Test the default template creation function."""
-        yaml_text = app.create_default_template()
+        yaml_text = app_module.create_default_template()
         
         # Parse the YAML to verify it's valid
-        data = yaml.safe_load(yaml_text)
+        data = yaml.load(yaml_text, Loader=_YamlLoader)
         
         assert data['name'] == 'default_template'
         assert 'description' in data
@@ -76,55 +86,46 @@ class TestStreamlitApp:
         assert 'contains_phrase' in rule_types
         assert 'word_count' in rule_types
     
-    def test_parse_template_yaml(self):
-        """Test parsing YAML into a Template object."""
-        yaml_text = """
-        name: test_template
-        description: A test template
-        rules:
-          - type: contains_phrase
-            weight: 2.0
-            params:
-              phrase: "helpful"
-          - type: word_count
-            weight: 1.0
-            params:
-              min_words: 5
-              max_words: 20
-        """
-        
-        template, error = app.parse_template_yaml(yaml_text)
-        
+    @pytest.mark.parametrize("via_stream", [False, True], ids=["inline", "stream"])
+    def test_yaml_roundtrip(self, app_module, via_stream):
+        """Test parsing YAML into a Template, optionally through a to_yaml/from_yaml save and load."""
+        template, error = app_module.parse_template_yaml(_GOOD_TEMPLATE_YAML)
         assert error is None
         assert template is not None
-        assert template.name == "test_template"
-        assert template.description == "A test template"
-        assert len(template.rules) == 2
-        assert template.rules[0].rule_type == "contains_phrase"
-        assert template.rules[0].weight == 2.0
-        assert template.rules[0].params['phrase'] == "helpful"
+        
+        if via_stream:
+            # Serialization round-trip only; file paths are covered in tests/unit/test_template.py
+            buf = io.StringIO()
+            template.to_yaml(buf)
+            buf.seek(0)
+            loaded_template = Template.from_yaml(buf)
+            
+            # Both templates should give the same score
+            test_text = "Python is a helpful language for beginners"
+            assert loaded_template.evaluate(test_text) == template.evaluate(test_text)
+            template = loaded_template
+        
+        assert template.name == _GOOD_TEMPLATE_PARSED['name']
+        assert template.description == _GOOD_TEMPLATE_PARSED['description']
+        assert len(template.rules) == len(_GOOD_TEMPLATE_PARSED['rules'])
+        for rule, expected in zip(template.rules, _GOOD_TEMPLATE_PARSED['rules']):
+            assert rule.rule_type == expected['type']
+            assert rule.weight == expected['weight']
+            assert rule.params == expected['params']
     
-    def test_parse_template_yaml_error(self):
+    def test_parse_template_yaml_error(self, app_module):
         """Test error handling when parsing invalid YAML."""
-        yaml_text = """
-        name: invalid
-        description: Invalid YAML
-        rules:
-          - type: contains_phrase
-            weight: not_a_number
-        """
-        
-        template, error = app.parse_template_yaml(yaml_text)
+        template, error = app_module.parse_template_yaml(_BAD_WEIGHT_TEMPLATE_YAML)
         
         assert template is None
         assert error is not None
         assert "not_a_number" in error.lower()
     
-    def test_score_text_with_template(self, default_template):
+    def test_score_text_with_template(self, app_module, default_template):
         """Test scoring text with a template."""
         text = "Python is a helpful programming language"
         
-        result, error = app.score_text_with_template(text, default_template)
+        result, error = app_module.score_text_with_template(text, default_template)
         
         assert error is None
         assert result is not None
@@ -133,81 +134,37 @@ class TestStreamlitApp:
         assert 'rule_scores' in result
         assert len(result['rule_scores']) == 2
     
-    def test_create_score_chart(self):
+    def test_create_score_chart(self, app_module):
         """Test creating a score chart from history."""
         scores_history = [
             {'score': 0.5, 'text': 'Test 1', 'timestamp': '2025-07-19T12:00:00'},
             {'score': 0.8, 'text': 'Test 2', 'timestamp': '2025-07-19T12:01:00'},
         ]
         
-        chart = app.create_score_chart(scores_history)
+        chart = app_module.create_score_chart(scores_history)
         
         assert chart is not None
     
-    @patch('app.parse_template_yaml')
-    @patch('app.score_text_with_template')
-    def test_main_function_with_scoring(self, mock_score, mock_parse, mock_streamlit, default_template):
+    def test_main_function_with_scoring(self):
         """Test the main function with text scoring workflow."""
-        # Setup mocks
-        mock_parse.return_value = (default_template, None)
-        mock_score.return_value = ({
-            'total_score': 0.75,
-            'total_weight': 2.0,
-            'rule_scores': [
-                {
-                    'rule_type': 'contains_phrase',
-                    'weight': 1.0,
-                    'raw_score': 1.0,
-                    'weighted_score': 1.0,
-                    'params': {'phrase': 'helpful'}
-                },
-                {
-                    'rule_type': 'word_count',
-                    'weight': 1.0,
-                    'raw_score': 0.5,
-                    'weighted_score': 0.5,
-                    'params': {'min_words': 3, 'max_words': 50}
-                }
-            ]
-        }, None)
-        
-        # Set session state
-        mock_streamlit.session_state.current_template = default_template
-        
-        # Run the main function
-        app.main()
-        
-        # Verify the template was loaded
-        assert mock_parse.called
-        
-        # Verify scoring was performed
-        assert mock_score.called
-        
-        # Verify UI elements were created
-        assert mock_streamlit.title.called
-        assert mock_streamlit.header.called
-        assert mock_streamlit.button.called
-    
-    def test_template_file_operations(self, mock_streamlit, default_template):
-        """Test template file operations (save/load)."""
-        # Create a temporary template file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            default_template.to_yaml(f.name)
-            yaml_path = f.name
-        
-        try:
-            # Load the template back
-            loaded_template = Template.from_yaml(yaml_path)
-            
-            # Verify template was loaded correctly
-            assert loaded_template.name == default_template.name
-            assert loaded_template.description == default_template.description
-            assert len(loaded_template.rules) == len(default_template.rules)
-            
-            # Test that both templates give same score
-            test_text = "Python is a helpful language for beginners"
-            assert default_template.evaluate(test_text) == loaded_template.evaluate(test_text)
-            
-        finally:
-            # Clean up
-            os.unlink(yaml_path)
\ No newline at end of file
+        # Importing plotly/pandas on the first script run can exceed the 3s default
+        at = AppTest.from_file(APP_PATH, default_timeout=30).run()
+        assert not at.exception
+        
+        # Verify UI elements were created and the default template was loaded
+        assert at.title[0].value == "🎯 ClarityAI"
+        assert [h.value for h in at.header] == ["📝 Rubric Editor", "🚀 Live Scoring", "📚 Help & Examples"]
+        assert at.session_state["current_template"].name == "default_template"
+        
+        # Type some text and score it
+        text_input = next(t for t in at.text_area if t.label == "Enter text to score:")
+        text_input.input("Python is a helpful programming language for beginners").run()
+        score_button = next(b for b in at.button if b.label == "🎯 Score Text")
+        score_button.click().run()
+        assert not at.exception
+        
+        # Verify scoring was performed and recorded
+        history = at.session_state["scores_history"]
+        assert len(history) == 1
+        assert 0.0 <= history[0]['score'] <= 1.0
+        assert at.metric[0].value == f"{history[0]['score']:.3f}"
@@ -6,291 +6,268 @@ to model saving, including training run creation, progress tracking, and ledger
 """
 
 import pytest
-import tempfile
+import shutil
 import os
-import subprocess
 import yaml
 import json
 from pathlib import Path
 from unittest.mock import patch, Mock
 
-from clarity.scorer import Template
+from clarity.cli import main
 from clarity.trainer import (
     TrainingConfig, 
     TrainingRun, 
     ClarityTrainer, 
     train_model, 
-    load_training_ledger
+    load_training_ledger,
+    save_training_ledger,
+    _parse_ledger_data,
+    _loads_json
 )
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+
+@pytest.fixture
+def make_run():
+    """Factory for TrainingRun objects that differ only in index and the given fields."""
+    def _make(i, status="completed", **kwargs):
+        return TrainingRun(
+            run_id=f"run_{i:03d}",
+            model_name=f"test/model{i}",
+            template_path=f"template{i}.yaml",
+            config=TrainingConfig(),
+            start_time="2024-01-01T00:00:00Z",
+            status=status,
+            **kwargs
+        )
+    return _make
+
+
+@pytest.fixture(scope="session")
+def cli_template(tmp_path_factory):
+    """Write the read-only CLI training template once per session."""
+    template_data = {
+        'name': 'cli_training_test',
+        'description': 'CLI training integration test',
+        'rules': [
+            {
+                'type': 'word_count',
+                'weight': 1.0,
+                'params': {'min_words': 1, 'max_words': 100}
+            }
+        ]
+    }
+    
+    template_path = tmp_path_factory.mktemp("cli_templates") / "cli_training_template.yaml"
+    template_path.write_text(yaml.dump(template_data, Dumper=_YamlDumper), encoding='utf-8')
+    return template_path
+
 
 class TestTrainingWorkflow:
     """Test complete training workflow from template loading to model saving."""
     
-    def test_training_config_creation_and_serialization(self):
-        """Test TrainingConfig creation, serialization, and deserialization."""
-        config = TrainingConfig(
-            model_name="microsoft/DialoGPT-small",
-            template_path="test_template.yaml",
-            max_steps=5,
-            learning_rate=1e-5,
-            batch_size=8
-        )
+    @pytest.mark.parametrize("obj,expected", [
+        (
+            TrainingConfig(
+                model_name="microsoft/DialoGPT-small",
+                template_path="test_template.yaml",
+                max_steps=5,
+                learning_rate=1e-5,
+                batch_size=8
+            ),
+            {'model_name': "microsoft/DialoGPT-small", 'max_steps': 5, 'learning_rate': 1e-5}
+        ),
+        (
+            TrainingRun(
+                run_id="test_run_123",
+                model_name="test/model",
+                template_path="test.yaml",
+                config=TrainingConfig(max_steps=3),
+                start_time="2024-01-01T00:00:00Z"
+            ),
+            {'run_id': "test_run_123", 'status': "running", 'step_rewards': [], 'total_steps': 0}
+        ),
+    ], ids=["config", "run"])
+    def test_serialization_roundtrip(self, obj, expected):
+        """Test TrainingConfig/TrainingRun dict and JSON bytes round-trips."""
+        cls = type(obj)
+        obj_dict = obj.to_dict()
+        for key, value in expected.items():
+            assert obj_dict[key] == value
         
-        # Test serialization
-        config_dict = config.to_dict()
-        assert config_dict['model_name'] == "microsoft/DialoGPT-small"
-        assert config_dict['max_steps'] == 5
-        assert config_dict['learning_rate'] == 1e-5
-        
-        # Test deserialization
-        restored_config = TrainingConfig.from_dict(config_dict)
-        assert restored_config.model_name == config.model_name
-        assert restored_config.max_steps == config.max_steps
-        assert restored_config.learning_rate == config.learning_rate
+        assert cls.from_dict(obj_dict) == obj
+        assert cls.from_json_bytes(obj.to_json_bytes()) == obj
     
-    def test_training_run_metadata_handling(self):
-        """Test TrainingRun creation and metadata management."""
-        config = TrainingConfig(max_steps=3)
+    def test_training_with_mocked_dependencies(self, mocked_transformers, word_count_template, tmp_path):
+        """Test training workflow with mocked transformers dependencies."""
+        temp_dir = str(tmp_path)
+        # Copy the shared test template
+        template_path = os.path.join(temp_dir, "mock_template.yaml")
+        shutil.copy(word_count_template, template_path)
         
-        run = TrainingRun(
-            run_id="test_run_123",
+        # Configure training
+        config = TrainingConfig(
             model_name="test/model",
-            template_path="test.yaml",
-            config=config,
-            start_time="2024-01-01T00:00:00Z"
+            template_path=template_path,
+            max_steps=3,
+            batch_size=2,
+            output_dir=temp_dir
         )
         
-        # Test initial state
-        assert run.run_id == "test_run_123"
-        assert run.status == "running"
-        assert run.step_rewards == []
-        assert run.total_steps == 0
+        # Run training
+        trainer = ClarityTrainer(config)
+        result = trainer.train()
         
-        # Test serialization
-        run_dict = run.to_dict()
-        assert 'config' in run_dict
-        assert run_dict['run_id'] == "test_run_123"
+        # Verify training completed
+        assert result['status'] == 'success'
+        assert result['total_steps'] == 3
+        assert isinstance(result['average_reward'], float)
+        assert isinstance(result['final_reward'], float)
         
-        # Test deserialization
-        restored_run = TrainingRun.from_dict(run_dict)
-        assert restored_run.run_id == run.run_id
-        assert restored_run.config.max_steps == config.max_steps
+        # Verify mocks were called
+        mocked_transformers.AutoTokenizer.from_pretrained.assert_called_once()
+        mocked_transformers.AutoModelForCausalLM.from_pretrained.assert_called_once()
+        mocked_transformers.Adam.assert_called_once()
     
-    def test_training_with_mocked_dependencies(self):
-        """Test training workflow with mocked transformers dependencies."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test template
-            template = Template("mock_training_test")
-            template.add_rule("word_count", 1.0, min_words=1)
-            
-            template_path = os.path.join(temp_dir, "mock_template.yaml")
-            template.to_yaml(template_path)
-            
-            # Mock transformers components
-            with patch('clarity.trainer.AutoTokenizer') as mock_tokenizer_class, \
-                 patch('clarity.trainer.AutoModelForCausalLM') as mock_model_class, \
-                 patch('torch.optim.Adam') as mock_optimizer:
-                
-                # Setup mocks
-                mock_tokenizer = Mock()
-                mock_tokenizer.pad_token = None
-                mock_tokenizer.eos_token = "<eos>"
-                mock_tokenizer.pad_token_id = 0
-                mock_tokenizer.eos_token_id = 1
-                mock_tokenizer.encode.return_value = [[1, 2, 3]]
-                mock_tokenizer.decode.return_value = "helpful response"
-                mock_tokenizer.save_pretrained = Mock()
-                mock_tokenizer_class.from_pretrained.return_value = mock_tokenizer
-                
-                mock_model = Mock()
-                mock_model.to.return_value = mock_model
-                mock_model.generate.return_value = [[1, 2, 3, 4, 5]]
-                mock_model.save_pretrained = Mock()
-                mock_model_class.from_pretrained.return_value = mock_model
-                
-                # Configure training
-                config = TrainingConfig(
-                    model_name="test/model",
-                    template_path=template_path,
-                    max_steps=3,
-                    batch_size=2,
-                    output_dir=temp_dir
-                )
-                
-                # Run training
-                trainer = ClarityTrainer(config)
-                result = trainer.train()
-                
-                # Verify training completed
-                assert result['status'] == 'success'
-                assert result['total_steps'] == 3
-                assert isinstance(result['average_reward'], float)
-                assert isinstance(result['final_reward'], float)
-                
-                # Verify mocks were called
-                mock_tokenizer_class.from_pretrained.assert_called_once()
-                mock_model_class.from_pretrained.assert_called_once()
-                mock_optimizer.assert_called_once()
-    
-    def test_training_error_handling(self):
+    def test_training_error_handling(self, tmp_path):
         """Test training error handling and recovery."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Test with non-existent template
-            config = TrainingConfig(
-                template_path="nonexistent.yaml",
-                output_dir=temp_dir
-            )
-            
-            trainer = ClarityTrainer(config)
-            result = trainer.train()
-            
-            assert result['status'] == 'error'
-            assert 'Template not found' in result['error']
+        temp_dir = str(tmp_path)
+        # Test with non-existent template
+        config = TrainingConfig(
+            template_path="nonexistent.yaml",
+            output_dir=temp_dir
+        )
+        
+        trainer = ClarityTrainer(config)
+        result = trainer.train()
+        
+        assert result['status'] == 'error'
+        assert 'Template not found' in result['error']
     
-    def test_training_ledger_management(self):
+    def test_training_ledger_management(self, make_run):
         """Test training ledger creation and management."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create multiple training runs
-            config1 = TrainingConfig(output_dir=temp_dir)
-            config2 = TrainingConfig(output_dir=temp_dir, max_steps=5)
-            
-            run1 = TrainingRun(
-                run_id="run_001",
-                model_name="test/model1",
-                template_path="template1.yaml",
-                config=config1,
-                start_time="2024-01-01T00:00:00Z",
-                status="completed",
-                total_steps=3,
-                average_reward=0.75
-            )
-            
-            run2 = TrainingRun(
-                run_id="run_002", 
-                model_name="test/model2",
-                template_path="template2.yaml",
-                config=config2,
-                start_time="2024-01-02T00:00:00Z",
-                status="failed",
-                error="Mock error"
-            )
-            
-            # Save runs to ledger
-            ledger_path = os.path.join(temp_dir, 'training_ledger.yaml')
-            ledger_data = {
-                'runs': [run1.to_dict(), run2.to_dict()]
-            }
-            
-            with open(ledger_path, 'w') as f:
-                yaml.dump(ledger_data, f)
-            
-            # Load and verify ledger
-            loaded_runs = load_training_ledger(temp_dir)
-            assert len(loaded_runs) == 2
-            
-            # Verify first run
-            assert loaded_runs[0].run_id == "run_001"
-            assert loaded_runs[0].status == "completed"
-            assert loaded_runs[0].total_steps == 3
-            assert loaded_runs[0].average_reward == 0.75
-            
-            # Verify second run
-            assert loaded_runs[1].run_id == "run_002"
-            assert loaded_runs[1].status == "failed"
-            assert loaded_runs[1].error == "Mock error"
+        # Create multiple training runs
+        run1 = make_run(1, total_steps=3, average_reward=0.75)
+        run2 = make_run(2, status="failed", error="Mock error")
+        
+        # Round-trip each run through the JSON bytes of a ledger line (orjson when
+        # installed); the file round-trip is covered by
+        # TestTrainingWorkflow.test_training_ledger_management in test_end_to_end.py
+        loaded_runs = _parse_ledger_data({'runs': [_loads_json(run.to_json_bytes()) for run in (run1, run2)]})
+        assert len(loaded_runs) == 2
+        
+        # Verify first run
+        assert loaded_runs[0].run_id == "run_001"
+        assert loaded_runs[0].status == "completed"
+        assert loaded_runs[0].total_steps == 3
+        assert loaded_runs[0].average_reward == 0.75
+        
+        # Verify second run
+        assert loaded_runs[1].run_id == "run_002"
+        assert loaded_runs[1].status == "failed"
+        assert loaded_runs[1].error == "Mock error"
     
-    def test_cli_training_integration(self):
+    @pytest.mark.parametrize("n", [1, 10, 100])
+    def test_training_ledger_scaling(self, make_run, n, tmp_path):
+        """Test saving and reloading ledgers of increasing size."""
+        runs = [make_run(i, total_steps=i, step_rewards=[0.5] * (i % 5)) for i in range(n)]
+        
+        save_training_ledger(str(tmp_path), runs)
+        loaded_runs = load_training_ledger(str(tmp_path))
+        
+        assert len(loaded_runs) == n
+        assert loaded_runs[0] == runs[0]
+        assert loaded_runs[-1] == runs[-1]
+    
+    def test_cli_training_integration(self, capsys, cli_template, tmp_path):
         """Test CLI training command integration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test template
-            template_data = {
-                'name': 'cli_training_test',
-                'description': 'CLI training integration test',
-                'rules': [
-                    {
-                        'type': 'word_count',
-                        'weight': 1.0,
-                        'params': {'min_words': 1, 'max_words': 100}
-                    }
-                ]
+        temp_dir = str(tmp_path)
+        template_path = str(cli_template)
+        
+        # Mock the training function to avoid actual model loading
+        with patch('clarity.trainer.train_model') as mock_train:
+            mock_train.return_value = {
+                "status": "success",
+                "run_id": "test_run_123",
+                "total_steps": 5,
+                "average_reward": 0.8,
+                "final_reward": 0.85,
+                "output_dir": os.path.join(temp_dir, "test_run_123")
             }
             
-            template_path = os.path.join(temp_dir, "cli_training_template.yaml")
-            with open(template_path, 'w') as f:
-                yaml.dump(template_data, f)
+            # Test CLI training command in-process through the argument parser
+            exit_code = main([
+                'train',
+                '--model', 'microsoft/DialoGPT-small',
+                '--template', template_path,
+                '--steps', '5',
+                '--learning-rate', '1.41e-5',
+                '--batch-size', '16',
+                '--output', temp_dir
+            ])
+            stdout = capsys.readouterr().out
+            
+            assert exit_code == 0
+            assert "Starting ClarityAI training" in stdout
+            assert "Training completed successfully" in stdout
+            assert "Run ID: test_run_123" in stdout
             
-            # Mock the training function to avoid actual model loading
-            with patch('clarity.trainer.train_model') as mock_train:
-                mock_train.return_value = {
-                    "status": "success",
-                    "run_id": "test_run_123",
-                    "total_steps": 5,
-                    "average_reward": 0.8,
-                    "final_reward": 0.85,
-                    "output_dir": os.path.join(temp_dir, "test_run_123")
-                }
-                
-                # Test CLI training command
-                result = subprocess.run([
-                    'python', '-m', 'clarity.cli', 'train',
-                    '--template', template_path,
-                    '--steps', '5',
-                    '--output', temp_dir
-                ], capture_output=True, text=True, cwd=os.getcwd())
-                
-                assert result.returncode == 0
-                assert "Starting ClarityAI training" in result.stdout
-                assert "Training completed successfully" in result.stdout
-                assert "Run ID:" in result.stdout
-                
-                # Training completed successfully (actual training ran)
+            # The CLI must go through the patched train_model, never a real run
+            mock_train.assert_called_once_with(
+                model_name='microsoft/DialoGPT-small',
+                template_path=template_path,
+                max_steps=5,
+                learning_rate=1.41e-5,
+                batch_size=16,
+                output_dir=temp_dir
+            )
     
-    def test_training_convenience_function(self):
+    def test_training_convenience_function(self, word_count_template, tmp_path):
         """Test the train_model convenience function."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test template
-            template = Template("convenience_test")
-            template.add_rule("word_count", 1.0, min_words=1)
+        temp_dir = str(tmp_path)
+        # Copy the shared test template
+        template_path = os.path.join(temp_dir, "convenience_template.yaml")
+        shutil.copy(word_count_template, template_path)
+        
+        # Mock the ClarityTrainer
+        with patch('clarity.trainer.ClarityTrainer') as mock_trainer_class:
+            mock_trainer = Mock()
+            mock_trainer.train.return_value = {
+                "status": "success",
+                "run_id": "convenience_run",
+                "total_steps": 10,
+                "average_reward": 0.7,
+                "final_reward": 0.8,
+                "output_dir": temp_dir
+            }
+            mock_trainer_class.return_value = mock_trainer
+            
+            # Call convenience function
+            result = train_model(
+                model_name="test/model",
+                template_path=template_path,
+                max_steps=10,
+                learning_rate=2e-5,
+                batch_size=8,
+                output_dir=temp_dir
+            )
             
-            template_path = os.path.join(temp_dir, "convenience_template.yaml")
-            template.to_yaml(template_path)
+            # Verify result
+            assert result['status'] == 'success'
+            assert result['run_id'] == 'convenience_run'
+            assert result['total_steps'] == 10
             
-            # Mock the ClarityTrainer
-            with patch('clarity.trainer.ClarityTrainer') as mock_trainer_class:
-                mock_trainer = Mock()
-                mock_trainer.train.return_value = {
-                    "status": "success",
-                    "run_id": "convenience_run",
-                    "total_steps": 10,
-                    "average_reward": 0.7,
-                    "final_reward": 0.8,
-                    "output_dir": temp_dir
-                }
-                mock_trainer_class.return_value = mock_trainer
-                
-                # Call convenience function
-                result = train_model(
-                    model_name="test/model",
-                    template_path=template_path,
-                    max_steps=10,
-                    learning_rate=2e-5,
-                    batch_size=8,
-                    output_dir=temp_dir
-                )
-                
-                # Verify result
-                assert result['status'] == 'success'
-                assert result['run_id'] == 'convenience_run'
-                assert result['total_steps'] == 10
-                
-                # Verify trainer was created with correct config
-                mock_trainer_class.assert_called_once()
-                config = mock_trainer_class.call_args[0][0]
-                assert config.model_name == "test/model"
-                assert config.template_path == template_path
-                assert config.max_steps == 10
-                assert config.learning_rate == 2e-5
-                assert config.batch_size == 8
-                assert config.output_dir == temp_dir
+            # Verify trainer was created with correct config
+            mock_trainer_class.assert_called_once()
+            config = mock_trainer_class.call_args[0][0]
+            assert config.model_name == "test/model"
+            assert config.template_path == template_path
+            assert config.max_steps == 10
+            assert config.learning_rate == 2e-5
+            assert config.batch_size == 8
+            assert config.output_dir == temp_dir
     
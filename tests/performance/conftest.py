@@ -0,0 +1,25 @@
+"""
+Shared fixtures for the performance tests.
+"""
+
+import gc
+
+import pytest
+
+
+@pytest.fixture
+def gc_paused():
+    """Disable automatic garbage collection for the duration of a timing test.
+    
+    Generation-0 collections triggered by the many short-lived strings and
+    lists that scoring allocates add noise to the measurements. Explicit
+    gc.collect() calls still run; memory tests should not use this fixture.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+        gc.collect()
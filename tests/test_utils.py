@@ -11,12 +11,17 @@ from unittest.mock import MagicMock
 
 from clarity.scorer import Template
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 
 def create_temp_template(template_data: Dict[str, Any], temp_dir: Path) -> Path:
     """Create a temporary template file for testing."""
     template_path = temp_dir / "temp_template.yaml"
     with open(template_path, 'w') as f:
-        yaml.dump(template_data, f)
+        yaml.dump(template_data, f, Dumper=_YamlDumper)
     return template_path
 
 
@@ -28,6 +28,7 @@ class TestScoreCommand:
         args.text = None
         args.template = "template.yaml"
         args.detailed = False
+        args.format = "text"
         
         # Mock file operations and scoring
         with patch('os.path.exists', side_effect=[True, True]), \
@@ -47,6 +48,7 @@ class TestScoreCommand:
         args.text = "Direct text input"
         args.template = "template.yaml"
         args.detailed = False
+        args.format = "text"
         
         with patch('os.path.exists', return_value=True), \
              patch('clarity.cli.score', return_value=0.75), \
@@ -57,6 +59,49 @@ class TestScoreCommand:
             assert result == 0
             mock_print.assert_called_with("Score: 0.750")
     
+    def test_score_command_json_format(self):
+        """Test score command with machine-readable JSON output."""
+        import json
+        
+        args = Mock()
+        args.text_file = None
+        args.text = "Direct text input"
+        args.template = "template.yaml"
+        args.detailed = False
+        args.format = "json"
+        
+        with patch('os.path.exists', return_value=True), \
+             patch('clarity.cli.score', return_value=0.75), \
+             patch('builtins.print') as mock_print:
+            
+            result = score_command(args)
+            
+            assert result == 0
+            assert json.loads(mock_print.call_args.args[0]) == {"score": 0.75}
+    
+    def test_score_command_detailed_json_format(self):
+        """Test detailed score command with JSON output."""
+        import json
+        
+        args = Mock()
+        args.text_file = None
+        args.text = "Test text"
+        args.template = "template.yaml"
+        args.detailed = True
+        args.format = "json"
+        
+        mock_detailed_result = {'total_score': 0.8, 'total_weight': 1.0, 'rule_scores': []}
+        
+        with patch('os.path.exists', return_value=True), \
+             patch('clarity.cli.score_detailed', return_value=mock_detailed_result), \
+             patch('builtins.print') as mock_print:
+            
+            result = score_command(args)
+            
+            assert result == 0
+            mock_print.assert_called_once()
+            assert json.loads(mock_print.call_args.args[0]) == mock_detailed_result
+    
     def test_score_command_with_detailed_output(self):
         """Test score command with detailed output."""
         args = Mock()
@@ -64,6 +109,7 @@ class TestScoreCommand:
         args.text = "Test text"
         args.template = "template.yaml"
         args.detailed = True
+        args.format = "text"
         
         mock_detailed_result = {
             'total_score': 0.8,
@@ -106,6 +152,7 @@ class TestScoreCommand:
         args.text = "Test text"
         args.template = "template.yaml"
         args.detailed = True
+        args.format = "text"
         
         mock_detailed_result = {
             'total_score': 0.5,
@@ -146,6 +193,7 @@ class TestScoreCommand:
         args.text = None
         args.template = "template.yaml"
         args.detailed = False
+        args.format = "text"
         
         with patch('os.path.exists', return_value=False), \
              patch('builtins.print') as mock_print:
@@ -162,6 +210,7 @@ class TestScoreCommand:
         args.text = "Test text"
         args.template = "nonexistent.yaml"
         args.detailed = False
+        args.format = "text"
         
         with patch('os.path.exists', return_value=False), \
              patch('builtins.print') as mock_print:
@@ -178,6 +227,7 @@ class TestScoreCommand:
         args.text = None
         args.template = "template.yaml"
         args.detailed = False
+        args.format = "text"
         
         with patch('builtins.print') as mock_print:
             result = score_command(args)
@@ -192,6 +242,7 @@ class TestScoreCommand:
         args.text = "Test text"
         args.template = "template.yaml"
         args.detailed = False
+        args.format = "text"
         
         with patch('os.path.exists', return_value=True), \
              patch('clarity.cli.score', side_effect=Exception("Scoring failed")), \
@@ -209,6 +260,7 @@ class TestScoreCommand:
         args.text = None
         args.template = "template.yaml"
         args.detailed = False
+        args.format = "text"
         
         # The file read error is not wrapped in try/except, so it will be raised
         with patch('os.path.exists', side_effect=[True, True]), \
@@ -618,6 +670,18 @@ class TestMainFunction:
             args = mock_score.call_args[0][0]
             assert args.text == 'test text'
             assert args.template == 'template.yaml'
+
+    def test_main_accepts_explicit_argv(self):
+        """Test main parses an explicit argument list instead of sys.argv."""
+        with patch('sys.argv', ['clarity']), \
+             patch('clarity.cli.train_command', return_value=0) as mock_train:
+
+            result = main(['train', '--template', 'template.yaml', '--steps', '5'])
+
+            assert result == 0
+            args = mock_train.call_args[0][0]
+            assert args.template == 'template.yaml'
+            assert args.steps == 5
     
     def test_main_demo_command_routing(self):
         """Test main function routes to demo command correctly."""
@@ -842,4 +906,5 @@ class TestCLIIntegration:
             main()
         
         # argparse exits with code 2 for unknown commands
-        assert exc_info.value.code == 2
\ No newline at end of file
+        assert exc_info.value.code == 2
+
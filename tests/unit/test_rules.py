@@ -2,8 +2,10 @@
 Unit tests for Rule class and all rule types in ClarityAI.
 """
 
+import pickle
+import re
 import pytest
-from clarity.scorer import Rule
+from clarity.scorer import Rule, _compile_pattern
 
 
 class TestRule:
@@ -29,6 +31,38 @@ class TestRule:
         assert rule.rule_type == "sentiment_positive"
         assert rule.weight == 1.0
         assert rule.params == {}
+    
+    def test_rule_dict_roundtrip(self):
+        """Test converting a rule to and from its template YAML dict form."""
+        rule = Rule("word_count", 1.5, {"min_words": 10, "max_words": 50})
+        data = rule.to_dict()
+        assert data == {"type": "word_count", "weight": 1.5, "params": {"min_words": 10, "max_words": 50}}
+        assert Rule.from_dict(data) == rule
+    
+    def test_rule_from_dict_defaults(self):
+        """Test that weight and params are optional in the dict form."""
+        rule = Rule.from_dict({"type": "sentiment_positive"})
+        assert rule.weight == 1.0
+        assert rule.params == {}
+        assert Rule.from_dict({"type": "sentiment_positive", "params": None}).params == {}
+    
+    def test_matcher_rebuilt_when_params_change(self):
+        """Test that the cached matcher follows in-place params edits."""
+        rule = Rule("contains_phrase", 1.0, {"phrase": "helpful"})
+        assert rule.evaluate("This is helpful") == 1.0
+        
+        rule.params["phrase"] = "useful"
+        assert rule.evaluate("This is helpful") == 0.0
+        assert rule.evaluate("This is useful") == 1.0
+    
+    def test_rule_pickles_after_evaluation(self):
+        """Test that an evaluated rule still pickles and compares equal."""
+        rule = Rule("regex_match", 1.0, {"pattern": r"\d+"})
+        assert rule.evaluate("abc 123") == 1.0
+        
+        restored = pickle.loads(pickle.dumps(rule))
+        assert restored == rule
+        assert restored.evaluate("abc 123") == 1.0
 
 
 class TestContainsPhraseRule:
@@ -216,6 +250,21 @@ class TestRegexMatchRule:
         rule = Rule("regex_match", 1.0, {"pattern": ""})
         # Empty pattern matches everything in Python regex
         assert rule.evaluate("test") == 1.0
+    
+    def test_regex_match_shares_compiled_pattern(self):
+        """Test that rules with the same pattern reuse one compiled regex."""
+        _compile_pattern.cache_clear()
+        first = Rule("regex_match", 1.0, {"pattern": r"\d+"})
+        second = Rule("regex_match", 1.0, {"pattern": r"\d+"})
+        
+        assert first.evaluate("abc 123") == second.evaluate("abc 123") == 1.0
+        assert _compile_pattern.cache_info().misses == 1
+    
+    def test_regex_match_invalid_pattern(self):
+        """Test that a malformed pattern raises at evaluation time."""
+        rule = Rule("regex_match", 1.0, {"pattern": "["})
+        with pytest.raises(re.error):
+            rule.evaluate("test")
 
 
 class TestCosineSimilarityRule:
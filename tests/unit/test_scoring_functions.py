@@ -7,7 +7,7 @@ import tempfile
 import os
 from unittest.mock import patch, MagicMock
 
-from clarity.scorer import score, score_detailed, Template
+from clarity.scorer import score, score_batch, score_detailed, Template
 
 
 class TestScoreFunction:
@@ -129,6 +129,36 @@ rules:
             assert 0.0 <= result <= 1.0
 
 
+class TestScoreBatchFunction:
+    """Test the score_batch() public function."""
+    
+    def test_score_batch_matches_score(self):
+        """Test that score_batch gives the same scores as score per text."""
+        template = Template("batch_template")
+        template.add_rule("contains_phrase", 2.0, phrase="python")
+        template.add_rule("word_count", 1.0, min_words=3, max_words=10)
+        template.add_rule("regex_match", 1.0, pattern=r"\d+")
+        texts = ["python has 3 uses", "no match", "", "Python python python 42 " * 5]
+        
+        assert score_batch(texts, template) == [score(text, template) for text in texts]
+    
+    def test_score_batch_with_yaml_path(self, tmp_path):
+        """Test score_batch loading the template from a YAML path."""
+        template = Template("batch_yaml")
+        template.add_rule("contains_phrase", 1.0, phrase="helpful")
+        yaml_path = str(tmp_path / "batch.yaml")
+        template.to_yaml(yaml_path)
+        
+        assert score_batch(["very helpful", "unhelpful? no", "nope"], yaml_path) == [1.0, 1.0, 0.0]
+    
+    def test_score_batch_empty(self):
+        """Test score_batch with no texts."""
+        template = Template("empty_batch")
+        template.add_rule("contains_phrase", 1.0, phrase="python")
+        
+        assert score_batch([], template) == []
+
+
 class TestScoreDetailedFunction:
     """Test the score_detailed() public function."""
     
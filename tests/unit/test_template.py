@@ -2,13 +2,19 @@
 Unit tests for Template class in ClarityAI.
 """
 
+import io
 import pytest
 import tempfile
 import os
 import yaml
 from unittest.mock import patch, mock_open
 
-from clarity.scorer import Template, Rule
+from clarity.scorer import Template, Rule, _load_template_cached
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 
 class TestTemplate:
@@ -177,6 +183,46 @@ class TestTemplateEvaluation:
         # Should return 0.0 when total weight is 0
         assert template.evaluate("python programming") == 0.0
 
+    def test_evaluate_batch_matches_evaluate(self):
+        """Test that batch evaluation gives the same scores as per-text evaluation."""
+        template = Template("batch")
+        template.add_rule("contains_phrase", 2.0, phrase="Python")
+        template.add_rule("regex_match", 1.0, pattern=r"\d+")
+        template.add_rule("cosine_sim", 1.0, target="clear helpful code")
+        template.add_rule("word_count", 1.5, min_words=3, max_words=6)
+        template.add_rule("sentiment_positive", 0.5)
+        texts = ["python is great", "write 3 clear helpful lines of code", "", "nothing here"]
+
+        assert template.evaluate_batch(texts) == [template.evaluate(text) for text in texts]
+        assert Template("empty").evaluate_batch(texts) == [0.0] * len(texts)
+
+    def test_evaluate_batch_skips_failing_rule_per_text(self):
+        """Test that a rule failing on one text only drops that rule for that text."""
+        template = Template("batch_errors")
+        template.add_rule("contains_phrase", 1.0, phrase="python")
+        template.add_rule("word_count", 1.0, min_words=1, max_words=5)
+
+        # None has no .lower(), so both rules fail for it and it scores 0.0
+        assert template.evaluate_batch(["python code", None]) == [1.0, 0.0]
+
+    def test_evaluate_lowercases_text_once(self):
+        """Test that rules scoring the same text share one lowercased copy."""
+        class CountingStr(str):
+            lower_calls = 0
+            
+            def lower(self):
+                CountingStr.lower_calls += 1
+                return super().lower()
+        
+        template = Template("shared_lower")
+        template.add_rule("contains_phrase", 1.0, phrase="python")
+        template.add_rule("contains_phrase", 1.0, phrase="code")
+        template.add_rule("cosine_sim", 1.0, target="python code")
+        template.add_rule("sentiment_positive", 1.0)
+        
+        assert template.evaluate(CountingStr("Python code is clear")) == template.evaluate("Python code is clear")
+        assert CountingStr.lower_calls == 1
+
 
 class TestTemplateDetailedEvaluation:
     """Test template detailed evaluation functionality."""
@@ -276,7 +322,7 @@ class TestTemplateYAMLSerialization:
             assert os.path.exists(yaml_path)
             
             with open(yaml_path, 'r') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
             
             assert data['name'] == "simple"
             assert data['description'] == "A simple test template"
@@ -303,7 +349,7 @@ class TestTemplateYAMLSerialization:
             template.to_yaml(yaml_path)
             
             with open(yaml_path, 'r') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
             
             assert data['name'] == "complex"
             assert len(data['rules']) == 3
@@ -326,22 +372,22 @@ class TestTemplateYAMLSerialization:
         finally:
             os.unlink(yaml_path)
     
-    def test_to_yaml_creates_directory(self):
+    def test_to_yaml_creates_directory(self, tmp_path):
         """Test that to_yaml creates necessary directories."""
         template = Template("dir_test")
         template.add_rule("contains_phrase", 1.0, phrase="test")
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yaml_path = os.path.join(temp_dir, "subdir", "template.yaml")
-            
-            # Directory doesn't exist yet
-            assert not os.path.exists(os.path.dirname(yaml_path))
-            
-            template.to_yaml(yaml_path)
-            
-            # Directory should be created
-            assert os.path.exists(os.path.dirname(yaml_path))
-            assert os.path.exists(yaml_path)
+        temp_dir = str(tmp_path)
+        yaml_path = os.path.join(temp_dir, "subdir", "template.yaml")
+        
+        # Directory doesn't exist yet
+        assert not os.path.exists(os.path.dirname(yaml_path))
+        
+        template.to_yaml(yaml_path)
+        
+        # Directory should be created
+        assert os.path.exists(os.path.dirname(yaml_path))
+        assert os.path.exists(yaml_path)
     
     def test_from_yaml_simple_template(self):
         """Test loading simple template from YAML."""
@@ -437,10 +483,33 @@ rules:
         finally:
             os.unlink(yaml_path)
     
+    def test_from_yaml_caches_parsed_file(self, tmp_path):
+        """Test that an unchanged file is parsed once and a rewritten one is reparsed."""
+        _load_template_cached.cache_clear()
+        yaml_path = tmp_path / "cached.yaml"
+        yaml_path.write_text("name: first\nrules:\n  - type: contains_phrase\n    params:\n      phrase: a\n")
+
+        with patch('clarity.scorer.yaml.load', wraps=yaml.load) as mock_load:
+            first = Template.from_yaml(str(yaml_path))
+            first.rules[0].params['phrase'] = 'mutated'
+            second = Template.from_yaml(str(yaml_path))
+            assert mock_load.call_count == 1
+            assert second is not first
+            assert second.rules[0].params['phrase'] == 'a'
+
+            yaml_path.write_text("name: second\nrules: []\n")
+            os.utime(yaml_path, ns=(0, os.stat(yaml_path).st_mtime_ns + 1))
+            assert Template.from_yaml(str(yaml_path)).name == "second"
+            assert mock_load.call_count == 2
+
     def test_from_yaml_file_not_found(self):
         """Test loading from non-existent file."""
-        with pytest.raises(FileNotFoundError, match="Template file not found"):
+        with pytest.raises(FileNotFoundError, match="Template file not found") as exc_info:
             Template.from_yaml("nonexistent_file.yaml")
+        
+        # The os.stat() error is not chained into the traceback
+        assert exc_info.value.__cause__ is None
+        assert exc_info.value.__suppress_context__
     
     def test_from_yaml_malformed_yaml(self):
         """Test loading from malformed YAML file."""
@@ -502,6 +571,23 @@ rules:
                 
         finally:
             os.unlink(yaml_path)
+    
+    def test_yaml_roundtrip_file_object(self):
+        """Test saving to and loading from an in-memory file object."""
+        original = Template("stream_test")
+        original.description = "Round-trip through a file object"
+        original.add_rule("contains_phrase", 2.0, phrase="python")
+        original.add_rule("word_count", 1.0, min_words=3, max_words=15)
+        
+        buf = io.StringIO()
+        original.to_yaml(buf)
+        buf.seek(0)
+        loaded = Template.from_yaml(buf)
+        
+        assert loaded.name == original.name
+        assert loaded.description == original.description
+        assert [(r.rule_type, r.weight, r.params) for r in loaded.rules] == \
+            [(r.rule_type, r.weight, r.params) for r in original.rules]
 
 
 class TestTemplateErrorHandling:
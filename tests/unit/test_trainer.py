@@ -8,8 +8,10 @@ import os
 import yaml
 from unittest.mock import Mock, MagicMock, patch, mock_open
 from datetime import datetime, timezone
+from dataclasses import fields
 
 from clarity.trainer import ClarityTrainer, TrainingConfig, TrainingRun
+from clarity.scorer import Template
 
 
 class TestClarityTrainerInitialization:
@@ -115,6 +117,19 @@ class TestClarityTrainerTemplateLoading:
         
         with pytest.raises(yaml.YAMLError):
             trainer.load_template()
+    
+    @patch('clarity.trainer.Template.from_yaml')
+    @patch('os.path.exists')
+    def test_load_template_in_memory(self, mock_exists, mock_from_yaml):
+        """Test that a template passed to the trainer is used without file I/O."""
+        template = Template("in_memory")
+        
+        config = TrainingConfig(template_path="unused/template.yaml")
+        trainer = ClarityTrainer(config, template=template)
+        
+        assert trainer.load_template() is template
+        mock_exists.assert_not_called()
+        mock_from_yaml.assert_not_called()
 
 
 class TestClarityTrainerModelLoading:
@@ -376,20 +391,22 @@ class TestClarityTrainerRewardComputation:
         
         # Mock template
         mock_template = Mock()
-        mock_template.evaluate.side_effect = [0.8, 0.6, 0.9]  # Different scores
+        mock_template.evaluate_batch.return_value = [0.8, 0.6, 0.9]  # Different scores
         trainer.template = mock_template
         
         responses = ["Good response", "Average response", "Excellent response"]
         rewards = trainer.compute_rewards(responses)
         
         assert rewards == [0.8, 0.6, 0.9]
-        assert mock_template.evaluate.call_count == 3
+        mock_template.evaluate_batch.assert_called_once_with(responses)
+        mock_template.evaluate.assert_not_called()
     
     def test_compute_rewards_empty_responses(self):
         """Test reward computation with empty responses."""
         config = TrainingConfig()
         trainer = ClarityTrainer(config)
         trainer.template = Mock()
+        trainer.template.evaluate_batch.return_value = []
         
         rewards = trainer.compute_rewards([])
         
@@ -400,15 +417,29 @@ class TestClarityTrainerRewardComputation:
         config = TrainingConfig()
         trainer = ClarityTrainer(config)
         
-        mock_template = Mock()
-        mock_template.evaluate.side_effect = [0.8, Exception("Evaluation error"), 0.9]
-        trainer.template = mock_template
+        template = Template("reward_test")
+        template.add_rule("contains_phrase", 1.0, phrase="good")
+        trainer.template = template
         
-        responses = ["Good response", "Error response", "Excellent response"]
+        # The rule raises on the None response; evaluate_batch() drops it there
+        responses = ["Good response", None, "Another good response"]
         rewards = trainer.compute_rewards(responses)
         
         # Should handle error gracefully and return 0.0 for failed evaluation
-        assert rewards == [0.8, 0.0, 0.9]
+        assert rewards == [1.0, 0.0, 1.0]
+    
+    def test_compute_rewards_does_not_retry_batch_errors(self):
+        """Test that an error from evaluate_batch() is not retried response by response."""
+        config = TrainingConfig()
+        trainer = ClarityTrainer(config)
+        
+        mock_template = Mock()
+        mock_template.evaluate_batch.side_effect = RuntimeError("scorer bug")
+        trainer.template = mock_template
+        
+        with pytest.raises(RuntimeError, match="scorer bug"):
+            trainer.compute_rewards(["Test response"])
+        mock_template.evaluate.assert_not_called()
     
     def test_compute_rewards_no_template(self):
         """Test reward computation without template."""
@@ -454,10 +485,10 @@ class TestClarityTrainerRunManagement:
     
     @patch('builtins.open', new_callable=mock_open)
     @patch('os.path.exists')
-    @patch('yaml.safe_load')
-    @patch('yaml.dump')
+    @patch('clarity.trainer._loads_json')
+    @patch('clarity.trainer._dumps_json', return_value=b'{}')
     @patch('clarity.trainer.datetime')
-    def test_save_training_run_new_ledger(self, mock_datetime, mock_yaml_dump, mock_yaml_load, mock_exists, mock_file):
+    def test_save_training_run_new_ledger(self, mock_datetime, mock_dumps_json, mock_loads_json, mock_exists, mock_file):
         """Test saving training run to new ledger."""
         # Mock datetime
         mock_now_utc = Mock()
@@ -490,17 +521,17 @@ class TestClarityTrainerRunManagement:
         assert trainer.current_run.final_reward == 0.8
         
         # Verify file operations
-        mock_yaml_dump.assert_called_once()
-        ledger_data = mock_yaml_dump.call_args[0][0]
-        assert 'runs' in ledger_data
-        assert len(ledger_data['runs']) == 1
+        mock_dumps_json.assert_called_once()
+        run_data = mock_dumps_json.call_args[0][0]
+        assert run_data['run_id'] == "test_run"
+        mock_file.assert_called_with("test_runs/training_ledger.jsonl", 'ab')
     
     @patch('builtins.open', new_callable=mock_open)
     @patch('os.path.exists')
-    @patch('yaml.safe_load')
-    @patch('yaml.dump')
+    @patch('clarity.trainer._loads_json')
+    @patch('clarity.trainer._dumps_json', return_value=b'{}')
     @patch('clarity.trainer.datetime')
-    def test_save_training_run_existing_ledger(self, mock_datetime, mock_yaml_dump, mock_yaml_load, mock_exists, mock_file):
+    def test_save_training_run_existing_ledger(self, mock_datetime, mock_dumps_json, mock_loads_json, mock_exists, mock_file):
         """Test saving training run to existing ledger."""
         # Mock datetime
         mock_now_utc = Mock()
@@ -510,7 +541,7 @@ class TestClarityTrainerRunManagement:
         
         # Mock file operations
         mock_exists.return_value = True  # Existing ledger
-        mock_yaml_load.return_value = {'runs': [{'existing': 'run'}]}
+        mock_loads_json.return_value = {'runs': [{'existing': 'run'}]}
         
         config = TrainingConfig(output_dir="test_runs")
         trainer = ClarityTrainer(config)
@@ -527,10 +558,12 @@ class TestClarityTrainerRunManagement:
         
         trainer.save_training_run()
         
-        # Verify file operations
-        mock_yaml_dump.assert_called_once()
-        ledger_data = mock_yaml_dump.call_args[0][0]
-        assert len(ledger_data['runs']) == 2  # Existing + new run
+        # Verify file operations: the new run is appended without
+        # reading or rewriting the existing ledger
+        mock_loads_json.assert_not_called()
+        mock_dumps_json.assert_called_once()
+        assert mock_dumps_json.call_args[0][0]['run_id'] == "test_run"
+        mock_file.assert_called_once_with("test_runs/training_ledger.jsonl", 'ab')
     
     def test_save_training_run_no_current_run(self):
         """Test saving training run when no current run exists."""
@@ -567,7 +600,7 @@ class TestClarityTrainerRunManagement:
         
         with patch('builtins.open', mock_open()), \
              patch('os.path.exists', return_value=False), \
-             patch('yaml.dump'):
+             patch('clarity.trainer._dumps_json', return_value=b'{}'):
             trainer.save_training_run()
         
         # Should handle empty rewards gracefully
@@ -575,16 +608,61 @@ class TestClarityTrainerRunManagement:
         assert trainer.current_run.final_reward == 0.0
 
 
+class TestTrainingRunSerialization:
+    """Test TrainingRun JSON bytes serialization."""
+    
+    def _make_run(self):
+        return TrainingRun(
+            run_id="bytes_run",
+            model_name="test/model",
+            template_path="test/template.yaml",
+            config=TrainingConfig(max_steps=3),
+            start_time="2024-01-01T12:00:00+00:00",
+            status="completed",
+            step_rewards=[0.25, 0.5, 0.75]
+        )
+    
+    def test_to_dict_covers_all_fields(self):
+        """Test that to_dict emits every dataclass field and copies step rewards."""
+        run = self._make_run()
+        
+        run_dict = run.to_dict()
+        
+        assert set(run_dict) == {field.name for field in fields(TrainingRun)}
+        assert run_dict['config'] == run.config.to_dict()
+        assert run_dict['step_rewards'] is not run.step_rewards
+    
+    def test_json_bytes_roundtrip(self):
+        """Test that to_json_bytes -> from_json_bytes preserves the run."""
+        run = self._make_run()
+        
+        data = run.to_json_bytes()
+        
+        assert isinstance(data, bytes)
+        assert TrainingRun.from_json_bytes(data) == run
+    
+    def test_json_bytes_roundtrip_without_orjson(self):
+        """Test the stdlib json fallback produces the same round-trip."""
+        run = self._make_run()
+        
+        with patch('clarity.trainer.ORJSON_AVAILABLE', False):
+            data = run.to_json_bytes()
+            restored_run = TrainingRun.from_json_bytes(data)
+        
+        assert isinstance(data, bytes)
+        assert restored_run == run
+
+
 class TestClarityTrainerIntegration:
     """Test ClarityTrainer integration scenarios."""
     
     @patch('clarity.trainer.os.makedirs')
     @patch('builtins.open', new_callable=mock_open)
     @patch('os.path.exists')
-    @patch('yaml.safe_load')
-    @patch('yaml.dump')
+    @patch('clarity.trainer._loads_json')
+    @patch('clarity.trainer._dumps_json', return_value=b'{}')
     @patch('clarity.trainer.datetime')
-    def test_full_training_workflow_mock(self, mock_datetime, mock_yaml_dump, mock_yaml_load, 
+    def test_full_training_workflow_mock(self, mock_datetime, mock_dumps_json, mock_loads_json, 
                                         mock_exists, mock_file, mock_makedirs):
         """Test full training workflow with mocked dependencies."""
         # Mock datetime
@@ -597,7 +675,7 @@ class TestClarityTrainerIntegration:
         
         # Mock file operations
         mock_exists.side_effect = [True, False]  # Template exists, ledger doesn't
-        mock_yaml_load.return_value = None
+        mock_loads_json.return_value = None
         
         config = TrainingConfig(
             model_name="test/model",
@@ -3,7 +3,8 @@ Unit tests for TrainingConfig class in ClarityAI.
 """
 
 import pytest
-from dataclasses import fields
+from dataclasses import fields, replace, FrozenInstanceError
+from unittest.mock import patch
 from typing import Dict, Any
 
 from clarity.trainer import TrainingConfig
@@ -270,6 +271,26 @@ class TestTrainingConfigSerialization:
             restored_value = getattr(restored_config, field.name)
             assert original_value == restored_value, f"Field {field.name} mismatch: {original_value} != {restored_value}"
     
+    def test_json_bytes_roundtrip(self):
+        """Test that to_json_bytes -> from_json_bytes preserves all values."""
+        original_config = TrainingConfig(model_name="test/model", learning_rate=5e-5, do_sample=False)
+        
+        data = original_config.to_json_bytes()
+        
+        assert isinstance(data, bytes)
+        assert TrainingConfig.from_json_bytes(data) == original_config
+    
+    def test_json_bytes_roundtrip_without_orjson(self):
+        """Test the stdlib json fallback produces the same round-trip."""
+        original_config = TrainingConfig(model_name="test/model", top_k=10)
+        
+        with patch('clarity.trainer.ORJSON_AVAILABLE', False):
+            data = original_config.to_json_bytes()
+            restored_config = TrainingConfig.from_json_bytes(data)
+        
+        assert isinstance(data, bytes)
+        assert restored_config == original_config
+    
     def test_from_dict_partial_data(self):
         """Test creating config from dictionary with only some fields."""
         partial_dict = {
@@ -457,6 +478,18 @@ class TestTrainingConfigEquality:
         )
         
         assert config1 != config2
+    
+    def test_config_is_immutable_and_hashable(self):
+        """Test that configs are frozen and can be derived with replace()."""
+        config = TrainingConfig(max_steps=3)
+        
+        with pytest.raises(FrozenInstanceError):
+            config.max_steps = 5
+        
+        derived = replace(config, max_steps=5)
+        assert derived.max_steps == 5
+        assert config.max_steps == 3
+        assert hash(config) == hash(TrainingConfig(max_steps=3))
 
 
 class TestTrainingConfigIntegration:
@@ -3,13 +3,23 @@ Unit tests for training utility functions in ClarityAI.
 """
 
 import pytest
-import tempfile
 import os
+import json
 import yaml
-from unittest.mock import Mock, MagicMock, patch, mock_open
+from unittest.mock import Mock, MagicMock, patch, mock_open, call
 from typing import Dict, Any
+from pathlib import Path
 
-from clarity.trainer import train_model, load_training_ledger, TrainingConfig, TrainingRun, ClarityTrainer
+from clarity.trainer import (
+    train_model, load_training_ledger, save_training_ledger, TrainingConfig, TrainingRun, ClarityTrainer,
+    _read_ledger_file_cached, _parse_ledger_data, _loads_json, _copy_checkpoint,
+    append_training_run
+)
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
 
 
 class TestTrainModelFunction:
@@ -206,13 +216,21 @@ class TestTrainModelFunction:
 class TestLoadTrainingLedgerFunction:
     """Test the load_training_ledger() function."""
     
+    @pytest.fixture(autouse=True)
+    def clear_ledger_cache(self):
+        """Keep parsed ledgers from leaking between mocked tests."""
+        _read_ledger_file_cached.cache_clear()
+        yield
+        _read_ledger_file_cached.cache_clear()
+    
+    @patch('os.stat')
     @patch('builtins.open', new_callable=mock_open)
     @patch('os.path.exists')
-    @patch('yaml.safe_load')
-    def test_load_training_ledger_success(self, mock_yaml_load, mock_exists, mock_file):
+    @patch('clarity.trainer._loads_json')
+    def test_load_training_ledger_success(self, mock_loads_json, mock_exists, mock_file, mock_stat):
         """Test successful loading of training ledger."""
         # Setup mocks
-        mock_exists.return_value = True
+        mock_exists.side_effect = lambda path: path.endswith(".json")  # Legacy JSON ledger
         mock_ledger_data = {
             'runs': [
                 {
@@ -289,15 +307,15 @@ class TestLoadTrainingLedgerFunction:
                 }
             ]
         }
-        mock_yaml_load.return_value = mock_ledger_data
+        mock_loads_json.return_value = mock_ledger_data
         
         # Call function
         runs = load_training_ledger("test_runs")
         
         # Verify file operations
-        mock_exists.assert_called_once_with("test_runs/training_ledger.yaml")
-        mock_file.assert_called_once_with("test_runs/training_ledger.yaml", 'r')
-        mock_yaml_load.assert_called_once()
+        mock_exists.assert_called_with("test_runs/training_ledger.json")
+        mock_file.assert_called_once_with("test_runs/training_ledger.json", 'rb')
+        mock_loads_json.assert_called_once()
         
         # Verify results
         assert len(runs) == 2
@@ -328,71 +346,90 @@ class TestLoadTrainingLedgerFunction:
         
         runs = load_training_ledger("nonexistent_dir")
         
-        mock_exists.assert_called_once_with("nonexistent_dir/training_ledger.yaml")
+        assert mock_exists.call_args_list == [
+            call("nonexistent_dir/training_ledger.jsonl"),
+            call("nonexistent_dir/training_ledger.json"),
+            call("nonexistent_dir/training_ledger.yaml"),
+        ]
         assert runs == []
     
-    @patch('builtins.open', new_callable=mock_open)
+    @patch('os.stat')
+    @patch('builtins.open', new_callable=mock_open, read_data="")
     @patch('os.path.exists')
-    @patch('yaml.safe_load')
-    def test_load_training_ledger_empty_file(self, mock_yaml_load, mock_exists, mock_file):
+    def test_load_training_ledger_empty_file(self, mock_exists, mock_file, mock_stat):
         """Test loading ledger from empty file."""
-        mock_exists.return_value = True
-        mock_yaml_load.return_value = None  # Empty YAML file
+        mock_exists.side_effect = lambda path: path.endswith(".json")  # Legacy JSON ledger
         
-        # Should raise AttributeError when trying to call .get() on None
-        with pytest.raises(AttributeError):
+        # An empty file is not valid JSON
+        with pytest.raises(json.JSONDecodeError):
             load_training_ledger("test_runs")
     
+    @patch('os.stat')
     @patch('builtins.open', new_callable=mock_open)
     @patch('os.path.exists')
-    @patch('yaml.safe_load')
-    def test_load_training_ledger_no_runs_key(self, mock_yaml_load, mock_exists, mock_file):
+    @patch('clarity.trainer._loads_json')
+    def test_load_training_ledger_no_runs_key(self, mock_loads_json, mock_exists, mock_file, mock_stat):
         """Test loading ledger with no 'runs' key."""
-        mock_exists.return_value = True
-        mock_yaml_load.return_value = {'other_data': 'value'}  # No 'runs' key
+        mock_exists.side_effect = lambda path: path.endswith(".json")  # Legacy JSON ledger
+        mock_loads_json.return_value = {'other_data': 'value'}  # No 'runs' key
         
         runs = load_training_ledger("test_runs")
         
         assert runs == []
     
+    @patch('os.stat')
     @patch('builtins.open', new_callable=mock_open)
     @patch('os.path.exists')
-    @patch('yaml.safe_load')
-    def test_load_training_ledger_empty_runs(self, mock_yaml_load, mock_exists, mock_file):
+    @patch('clarity.trainer._loads_json')
+    def test_load_training_ledger_empty_runs(self, mock_loads_json, mock_exists, mock_file, mock_stat):
         """Test loading ledger with empty runs list."""
-        mock_exists.return_value = True
-        mock_yaml_load.return_value = {'runs': []}  # Empty runs list
+        mock_exists.side_effect = lambda path: path.endswith(".json")  # Legacy JSON ledger
+        mock_loads_json.return_value = {'runs': []}  # Empty runs list
         
         runs = load_training_ledger("test_runs")
         
         assert runs == []
     
-    @patch('builtins.open', new_callable=mock_open)
     @patch('os.path.exists')
-    @patch('yaml.safe_load')
-    def test_load_training_ledger_default_output_dir(self, mock_yaml_load, mock_exists, mock_file):
+    def test_load_training_ledger_default_output_dir(self, mock_exists):
         """Test loading ledger with default output directory."""
         mock_exists.return_value = False
         
         runs = load_training_ledger()  # No output_dir specified
         
-        mock_exists.assert_called_once_with("runs/training_ledger.yaml")  # Default
+        mock_exists.assert_any_call("runs/training_ledger.jsonl")  # Default
         assert runs == []
     
+    @patch('os.stat')
     @patch('builtins.open', new_callable=mock_open)
     @patch('os.path.exists')
-    @patch('yaml.safe_load')
-    def test_load_training_ledger_yaml_error(self, mock_yaml_load, mock_exists, mock_file):
-        """Test loading ledger when YAML parsing fails."""
-        mock_exists.return_value = True
+    @patch('yaml.load')
+    def test_load_training_ledger_legacy_yaml(self, mock_yaml_load, mock_exists, mock_file, mock_stat):
+        """Test loading a legacy YAML ledger when no JSON ledger exists."""
+        mock_exists.side_effect = lambda path: path.endswith(".yaml")
+        mock_yaml_load.return_value = {'runs': []}
+        
+        runs = load_training_ledger("test_runs")
+        
+        mock_file.assert_called_once_with("test_runs/training_ledger.yaml", 'rb')
+        assert runs == []
+    
+    @patch('os.stat')
+    @patch('builtins.open', new_callable=mock_open)
+    @patch('os.path.exists')
+    @patch('yaml.load')
+    def test_load_training_ledger_yaml_error(self, mock_yaml_load, mock_exists, mock_file, mock_stat):
+        """Test loading ledger when legacy YAML parsing fails."""
+        mock_exists.side_effect = lambda path: path.endswith(".yaml")
         mock_yaml_load.side_effect = yaml.YAMLError("Invalid YAML")
         
         with pytest.raises(yaml.YAMLError):
             load_training_ledger("test_runs")
     
+    @patch('os.stat')
     @patch('builtins.open', new_callable=mock_open)
     @patch('os.path.exists')
-    def test_load_training_ledger_file_read_error(self, mock_exists, mock_file):
+    def test_load_training_ledger_file_read_error(self, mock_exists, mock_file, mock_stat):
         """Test loading ledger when file reading fails."""
         mock_exists.return_value = True
         mock_file.side_effect = IOError("File read error")
@@ -400,12 +437,13 @@ class TestLoadTrainingLedgerFunction:
         with pytest.raises(IOError):
             load_training_ledger("test_runs")
     
+    @patch('os.stat')
     @patch('builtins.open', new_callable=mock_open)
     @patch('os.path.exists')
-    @patch('yaml.safe_load')
-    def test_load_training_ledger_malformed_run_data(self, mock_yaml_load, mock_exists, mock_file):
+    @patch('clarity.trainer._loads_json')
+    def test_load_training_ledger_malformed_run_data(self, mock_loads_json, mock_exists, mock_file, mock_stat):
         """Test loading ledger with malformed run data."""
-        mock_exists.return_value = True
+        mock_exists.side_effect = lambda path: path.endswith(".json")  # Legacy JSON ledger
         mock_ledger_data = {
             'runs': [
                 {
@@ -443,13 +481,167 @@ class TestLoadTrainingLedgerFunction:
                 }
             ]
         }
-        mock_yaml_load.return_value = mock_ledger_data
+        mock_loads_json.return_value = mock_ledger_data
         
         # Should raise error when trying to create TrainingRun from malformed data
         with pytest.raises((TypeError, KeyError)):
             load_training_ledger("test_runs")
 
 
+class TestSaveTrainingLedgerFunction:
+    """Test the save_training_ledger() function."""
+    
+    def _make_run(self, run_id):
+        return TrainingRun(
+            run_id=run_id,
+            model_name="test/model",
+            template_path="test/template.yaml",
+            config=TrainingConfig(),
+            start_time="2024-01-01T12:00:00+00:00",
+            step_rewards=[0.5]
+        )
+    
+    def test_save_training_ledger_round_trip(self, tmp_path):
+        """Test that saved runs are written as JSON Lines and load back unchanged."""
+        config = TrainingConfig(max_steps=3)
+        run = TrainingRun(
+            run_id="json_run",
+            model_name="test/model",
+            template_path="test/template.yaml",
+            config=config,
+            start_time="2024-01-01T12:00:00+00:00",
+            status="completed",
+            step_rewards=[0.5, 0.75]
+        )
+        
+        temp_dir = str(tmp_path)
+        ledger_path = save_training_ledger(temp_dir, [run])
+        
+        assert ledger_path == os.path.join(temp_dir, "training_ledger.jsonl")
+        with open(ledger_path, 'r') as f:
+            assert [json.loads(line) for line in f] == [run.to_dict()]
+        
+        runs = load_training_ledger(temp_dir)
+        assert runs == [run]
+    
+    def test_json_ledger_preferred_over_legacy_yaml(self, tmp_path):
+        """Test that the JSON Lines ledger takes precedence over a legacy YAML ledger."""
+        run = TrainingRun(
+            run_id="json_run",
+            model_name="test/model",
+            template_path="test/template.yaml",
+            config=TrainingConfig(),
+            start_time="2024-01-01T12:00:00+00:00"
+        )
+        
+        temp_dir = str(tmp_path)
+        with open(os.path.join(temp_dir, "training_ledger.yaml"), 'w') as f:
+            yaml.dump({'runs': []}, f, Dumper=_YamlDumper, default_flow_style=True, sort_keys=False)
+        save_training_ledger(temp_dir, [run])
+        
+        runs = load_training_ledger(temp_dir)
+        assert [r.run_id for r in runs] == ["json_run"]
+    
+    def test_append_training_run_adds_one_line(self, tmp_path):
+        """Test that appending a run leaves earlier ledger lines untouched."""
+        first, second = self._make_run("run_1"), self._make_run("run_2")
+        
+        temp_dir = str(tmp_path)
+        ledger_path = save_training_ledger(temp_dir, [first])
+        before = Path(ledger_path).read_bytes()
+        
+        assert append_training_run(temp_dir, second) == ledger_path
+        after = Path(ledger_path).read_bytes()
+        assert after.startswith(before)
+        assert json.loads(after[len(before):]) == second.to_dict()
+        assert load_training_ledger(temp_dir) == [first, second]
+    
+    def test_append_training_run_migrates_legacy_ledger(self, tmp_path):
+        """Test that the first append carries runs over from a legacy JSON ledger."""
+        legacy, new = self._make_run("legacy_run"), self._make_run("new_run")
+        
+        (tmp_path / "training_ledger.json").write_text(json.dumps({'runs': [legacy.to_dict()]}))
+        append_training_run(str(tmp_path), new)
+        
+        assert load_training_ledger(str(tmp_path)) == [legacy, new]
+
+
+class TestParseLedgerData:
+    """Test building TrainingRun objects from parsed ledger data."""
+    
+    def test_parse_ledger_data_in_memory(self):
+        """Test that ledger dicts map back to equal TrainingRun objects without file I/O."""
+        run1 = TrainingRun(
+            run_id="run_001",
+            model_name="test/model1",
+            template_path="template1.yaml",
+            config=TrainingConfig(),
+            start_time="2024-01-01T00:00:00Z",
+            status="completed",
+            total_steps=3,
+            average_reward=0.75
+        )
+        run2 = TrainingRun(
+            run_id="run_002",
+            model_name="test/model2",
+            template_path="template2.yaml",
+            config=TrainingConfig(max_steps=5),
+            start_time="2024-01-02T00:00:00Z",
+            status="failed",
+            error="Mock error"
+        )
+        
+        runs = _parse_ledger_data({'runs': [run1.to_dict(), run2.to_dict()]})
+        
+        assert runs == [run1, run2]
+    
+    def test_parse_ledger_data_without_runs(self):
+        """Test that ledger data without a 'runs' key yields no runs."""
+        assert _parse_ledger_data({}) == []
+    
+    def test_parse_ledger_data_none(self):
+        """Test that an empty legacy YAML ledger (parsed as None) has no runs."""
+        assert _parse_ledger_data(None) == []
+
+
+class TestLoadTrainingLedgerCaching:
+    """Test memoization of parsed ledger files."""
+    
+    def _make_run(self, run_id):
+        return TrainingRun(
+            run_id=run_id,
+            model_name="test/model",
+            template_path="test/template.yaml",
+            config=TrainingConfig(),
+            start_time="2024-01-01T12:00:00+00:00",
+            step_rewards=[0.5]
+        )
+    
+    def test_unchanged_ledger_is_parsed_once(self, tmp_path):
+        """Test that re-loading an unchanged ledger reuses the parsed data."""
+        temp_dir = str(tmp_path)
+        save_training_ledger(temp_dir, [self._make_run("run_1")])
+        
+        with patch('clarity.trainer._loads_json', wraps=_loads_json) as mock_loads_json:
+            first = load_training_ledger(temp_dir)
+            second = load_training_ledger(temp_dir)
+        
+        assert mock_loads_json.call_count == 1
+        assert first == second
+        # Returned runs must not share mutable state with the cache
+        first[0].step_rewards.append(1.0)
+        assert load_training_ledger(temp_dir)[0].step_rewards == [0.5]
+    
+    def test_rewritten_ledger_is_reparsed(self, tmp_path):
+        """Test that rewriting the ledger invalidates the cached parse."""
+        temp_dir = str(tmp_path)
+        save_training_ledger(temp_dir, [self._make_run("run_1")])
+        assert [r.run_id for r in load_training_ledger(temp_dir)] == ["run_1"]
+        
+        save_training_ledger(temp_dir, [self._make_run("run_1"), self._make_run("run_2")])
+        assert [r.run_id for r in load_training_ledger(temp_dir)] == ["run_1", "run_2"]
+
+
 class TestTrainingUtilityFunctionsIntegration:
     """Test integration scenarios for training utility functions."""
     
@@ -531,19 +723,23 @@ class TestTrainingUtilityFunctionsIntegration:
     def test_load_training_ledger_path_handling(self):
         """Test that load_training_ledger handles different path formats correctly."""
         test_cases = [
-            ("runs", "runs/training_ledger.yaml"),
-            ("custom_runs", "custom_runs/training_ledger.yaml"),
-            ("path/with/subdirs", "path/with/subdirs/training_ledger.yaml"),
-            ("", "training_ledger.yaml"),
+            ("runs", "runs/training_ledger"),
+            ("custom_runs", "custom_runs/training_ledger"),
+            ("path/with/subdirs", "path/with/subdirs/training_ledger"),
+            ("", "training_ledger"),
         ]
         
-        for output_dir, expected_path in test_cases:
+        for output_dir, expected_stem in test_cases:
             with patch('os.path.exists') as mock_exists:
                 mock_exists.return_value = False
                 
                 runs = load_training_ledger(output_dir)
                 
-                mock_exists.assert_called_once_with(expected_path)
+                assert mock_exists.call_args_list == [
+                    call(expected_stem + ".jsonl"),
+                    call(expected_stem + ".json"),
+                    call(expected_stem + ".yaml"),
+                ]
                 assert runs == []
     
     def test_utility_functions_type_safety(self):
@@ -571,4 +767,37 @@ class TestTrainingUtilityFunctionsIntegration:
             config = mock_trainer_class.call_args[0][0]
             assert isinstance(config.max_steps, int)
             assert isinstance(config.learning_rate, float)
-            assert isinstance(config.batch_size, int)
\ No newline at end of file
+            assert isinstance(config.batch_size, int)
+
+class TestCopyCheckpoint:
+    """Test mirroring a saved checkpoint into another directory."""
+    
+    def test_copy_checkpoint_copies_files(self, tmp_path):
+        """Test that checkpoint files, including nested ones, are copied."""
+        src_dir = tmp_path / "checkpoint-4"
+        (src_dir / "nested").mkdir(parents=True)
+        (src_dir / "model.bin").write_bytes(b"weights")
+        (src_dir / "nested" / "vocab.json").write_text("{}")
+        
+        dst_dir = tmp_path / "final"
+        _copy_checkpoint(str(src_dir), str(dst_dir))
+        
+        assert (dst_dir / "model.bin").read_bytes() == b"weights"
+        assert (dst_dir / "nested" / "vocab.json").read_text() == "{}"
+        assert not os.path.samefile(src_dir / "model.bin", dst_dir / "model.bin")
+    
+    def test_writing_final_leaves_checkpoint_intact(self, tmp_path):
+        """Test that saving over final/ in place does not change the checkpoint."""
+        src_dir = tmp_path / "checkpoint-4"
+        src_dir.mkdir()
+        (src_dir / "model.bin").write_bytes(b"weights")
+        
+        dst_dir = tmp_path / "final"
+        _copy_checkpoint(str(src_dir), str(dst_dir))
+        
+        # save_pretrained() opens and truncates existing files
+        with open(dst_dir / "model.bin", 'wb') as f:
+            f.write(b"fine-tuned")
+        
+        assert (src_dir / "model.bin").read_bytes() == b"weights"
+        assert (dst_dir / "model.bin").read_bytes() == b"fine-tuned"
@@ -4,7 +4,6 @@ Shows training progress, metrics, and model evaluation
 """
 import streamlit as st
 import json
-import yaml
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -17,6 +16,7 @@ from transformers import AutoTokenizer, AutoModelForCausalLM
 # Add clarity-ai to path
 sys.path.append('/Users/coreyalejandro/Repos/clarity-ai')
 from clarity.scorer import Template
+from clarity.trainer import load_training_ledger as _load_runs
 
 def load_training_state(model_dir):
     """Load training state from checkpoint"""
@@ -28,11 +28,8 @@ def load_training_state(model_dir):
 
 def load_training_ledger():
     """Load old training runs from ledger"""
-    ledger_file = "runs/training_ledger.yaml"
-    if os.path.exists(ledger_file):
-        with open(ledger_file, 'r') as f:
-            return yaml.safe_load(f)
-    return {'runs': []}
+    # clarity.trainer finds the JSON Lines ledger or a legacy JSON/YAML one
+    return {'runs': [run.to_dict() for run in _load_runs("runs")]}
 
 def test_model_quick(model_path, template_path):
     """Quick test of a model"""